@@ -826,52 +826,82 @@ def list_notes(args, notebook: NoteBook):
     return header + table
 
 
-def _get_contacts_statistics(book: AddressBook) -> list[str]:
+def compute_statistics(book: AddressBook, notebook: NoteBook, days_ahead: int = 10) -> dict:
     """
-    Get contacts statistics.
+    Compute application statistics without formatting them.
 
     Args:
         book: AddressBook instance
+        notebook: NoteBook instance
+        days_ahead: Number of days ahead to look for birthdays
 
     Returns:
-        list[str]: List of formatted contact statistics lines
+        dict: Statistics with keys:
+            - contacts (int): Number of contacts
+            - notes (int): Number of notes
+            - top_tags (list[tuple[str, int]]): Up to 3 most used tags with counts
+            - days_ahead (int): Birthday look-ahead window in days
+            - upcoming (list[tuple]): (name, birthday_str, next_birthday, days_until, age)
+              for upcoming birthdays, sorted by days until birthday
     """
-    total_contacts = len(book.data)
-    return [f"{Fore.YELLOW}{Style.BRIGHT}📇 CONTACTS:{Style.RESET_ALL} {Fore.CYAN}{total_contacts}{Style.RESET_ALL}"]
+    all_notes = notebook.get_all_notes()
 
+    # Count tags in a single pass; newest-first order decides ties between equal counts
+    tag_counts = Counter(tag for note in all_notes for tag in note.tags)
+
+    today = datetime.now().date()
+    upcoming = []
+    for name, birthday_str in book.get_upcoming_birthdays(days_ahead=days_ahead):
+        bday_date, days_until, age = _calculate_birthday_info(birthday_str, today)
+        upcoming.append((name, birthday_str, bday_date, days_until, age))
 
-def _get_notes_statistics(notebook: NoteBook) -> list[str]:
+    # Sort by days until birthday
+    upcoming.sort(key=lambda x: x[3] if x[3] is not None else 999)
+
+    return {
+        "contacts": len(book.data),
+        "notes": len(all_notes),
+        "top_tags": tag_counts.most_common(3),
+        "days_ahead": days_ahead,
+        "upcoming": upcoming,
+    }
+
+
+def _format_contacts_statistics(stats: dict) -> list[str]:
     """
-    Get notes statistics including top tags.
+    Format contacts statistics.
 
     Args:
-        notebook: NoteBook instance
+        stats: Statistics returned by compute_statistics
 
     Returns:
-        list[str]: List of formatted note statistics lines
+        list[str]: List of formatted contact statistics lines
     """
-    all_notes = notebook.get_all_notes()
-    total_notes = len(all_notes)
+    return [f"{Fore.YELLOW}{Style.BRIGHT}📇 CONTACTS:{Style.RESET_ALL} {Fore.CYAN}{stats['contacts']}{Style.RESET_ALL}"]
 
-    stats = [f"{Fore.YELLOW}{Style.BRIGHT}📝 NOTES:{Style.RESET_ALL} {Fore.CYAN}{total_notes}{Style.RESET_ALL}"]
 
-    # Collect all tags
-    all_tags = []
-    for note in all_notes:
-        all_tags.extend(note.tags)
+def _format_notes_statistics(stats: dict) -> list[str]:
+    """
+    Format notes statistics including top tags.
 
-    tag_counts = Counter(all_tags)
-    top_tags = tag_counts.most_common(3)
+    Args:
+        stats: Statistics returned by compute_statistics
 
+    Returns:
+        list[str]: List of formatted note statistics lines
+    """
+    lines = [f"{Fore.YELLOW}{Style.BRIGHT}📝 NOTES:{Style.RESET_ALL} {Fore.CYAN}{stats['notes']}{Style.RESET_ALL}"]
+
+    top_tags = stats["top_tags"]
     if top_tags:
-        stats.append(f"{Fore.YELLOW}🔝 TOP 3 TAGS:{Style.RESET_ALL}")
+        lines.append(f"{Fore.YELLOW}🔝 TOP 3 TAGS:{Style.RESET_ALL}")
         for i, (tag, count) in enumerate(top_tags, 1):
-            stats.append(
+            lines.append(
                 f"    {Fore.CYAN}{i}.{Style.RESET_ALL} {Fore.GREEN}{tag}{Style.RESET_ALL} "
                 f"({Fore.BLUE}{count}{Style.RESET_ALL} notes)"
             )
 
-    return stats
+    return lines
 
 
 def _calculate_birthday_info(birthday_str: str, today: date) -> tuple[date | None, int | None, int | None]:
@@ -944,72 +974,72 @@ def _format_birthday_entry(name: str, birthday_str: str, bday_date: date | None,
     return f"  {emoji} {Fore.GREEN}{name}{Style.RESET_ALL} - {Fore.MAGENTA}{date_display}{Style.RESET_ALL} ({days_text}){age_text}"
 
 
-def _get_birthdays_statistics(book: AddressBook, days_ahead: int = 10) -> list[str]:
+def _format_birthdays_statistics(stats: dict) -> list[str]:
     """
-    Get upcoming birthdays statistics.
+    Format upcoming birthdays statistics.
 
     Args:
-        book: AddressBook instance
-        days_ahead: Number of days ahead to look for birthdays
+        stats: Statistics returned by compute_statistics
 
     Returns:
         list[str]: List of formatted birthday statistics lines
     """
-    stats = [f"{Fore.YELLOW}{Style.BRIGHT}🎂 UPCOMING BIRTHDAYS (next {days_ahead} days):{Style.RESET_ALL}"]
-
-    upcoming = book.get_upcoming_birthdays(days_ahead=days_ahead)
-
-    if not upcoming:
-        stats.append(f"  {Fore.WHITE}No birthdays in the next {days_ahead} days{Style.RESET_ALL}")
-        return stats
-
-    today = datetime.now().date()
-    birthday_list = []
+    days_ahead = stats["days_ahead"]
+    lines = [f"{Fore.YELLOW}{Style.BRIGHT}🎂 UPCOMING BIRTHDAYS (next {days_ahead} days):{Style.RESET_ALL}"]
 
-    for name, birthday_str in upcoming:
-        bday_date, days_until, age = _calculate_birthday_info(birthday_str, today)
-        birthday_list.append((name, birthday_str, bday_date, days_until, age))
-
-    # Sort by days until birthday
-    birthday_list.sort(key=lambda x: x[3] if x[3] is not None else 999)
+    if not stats["upcoming"]:
+        lines.append(f"  {Fore.WHITE}No birthdays in the next {days_ahead} days{Style.RESET_ALL}")
+        return lines
 
-    for name, birthday_str, bday_date, days_until, age in birthday_list:
-        formatted_entry = _format_birthday_entry(name, birthday_str, bday_date, days_until, age)
-        stats.append(formatted_entry)
+    for name, birthday_str, bday_date, days_until, age in stats["upcoming"]:
+        lines.append(_format_birthday_entry(name, birthday_str, bday_date, days_until, age))
 
-    return stats
+    return lines
 
 
-def show_statistics(book: AddressBook, notebook: NoteBook):
+def render_statistics(stats: dict) -> str:
     """
-    Show comprehensive application statistics.
+    Render statistics computed by compute_statistics for display.
 
     Args:
-        book: AddressBook instance
-        notebook: NoteBook instance
+        stats: Statistics returned by compute_statistics
 
     Returns:
         str: Formatted statistics
     """
-    stats = []
+    lines = []
 
     # Header
-    stats.append(_header_line())
-    stats.append(f"{Fore.CYAN}{' ' * 25}{Style.BRIGHT}📊 STATISTICS{Style.RESET_ALL}")
-    stats.append(_header_line() + "\n")
+    lines.append(_header_line())
+    lines.append(f"{Fore.CYAN}{' ' * 25}{Style.BRIGHT}📊 STATISTICS{Style.RESET_ALL}")
+    lines.append(_header_line() + "\n")
 
     # Contacts statistics
-    stats.extend(_get_contacts_statistics(book))
+    lines.extend(_format_contacts_statistics(stats))
 
     # Notes statistics
-    stats.extend(_get_notes_statistics(notebook))
-    stats.append("")
+    lines.extend(_format_notes_statistics(stats))
+    lines.append("")
 
     # Upcoming birthdays statistics
-    stats.extend(_get_birthdays_statistics(book, days_ahead=10))
-    stats.append("")
+    lines.extend(_format_birthdays_statistics(stats))
+    lines.append("")
 
     # Footer
-    stats.append(_header_line())
+    lines.append(_header_line())
+
+    return "\n".join(lines)
+
 
-    return "\n".join(stats)
+def show_statistics(book: AddressBook, notebook: NoteBook):
+    """
+    Show comprehensive application statistics.
+
+    Args:
+        book: AddressBook instance
+        notebook: NoteBook instance
+
+    Returns:
+        str: Formatted statistics
+    """
+    return render_statistics(compute_statistics(book, notebook, days_ahead=10))
@@ -78,6 +78,38 @@ def signal_handler(signum, frame):  # pylint: disable=unused-argument
     exit(0)
 
 
+# Command dispatch table: each handler takes (args, book, notebook).
+# Lambdas resolve the handler names at call time, so patching them still works.
+_COMMAND_HANDLERS = {
+    Command.HELLO: lambda args, book, notebook: "How can I help you?",
+    Command.ADD_CONTACT: lambda args, book, notebook: add_contact(args, book),
+    Command.UPDATE_CONTACT: lambda args, book, notebook: update_contact(args, book),
+    Command.SHOW_ALL_CONTACTS: lambda args, book, notebook: get_all_contacts(book),
+    Command.SEARCH_CONTACTS: lambda args, book, notebook: search_contacts(args, book),
+    Command.SHOW_CONTACT: lambda args, book, notebook: get_one_contact(args, book),
+    Command.DELETE_CONTACT: lambda args, book, notebook: delete_contact(args, book),
+    Command.SET_BIRTHDAY: lambda args, book, notebook: add_birthday(args, book),
+    Command.SHOW_BIRTHDAY: lambda args, book, notebook: show_birthday(args, book),
+    Command.DELETE_BIRTHDAY: lambda args, book, notebook: delete_birthday(args, book),
+    Command.SHOW_UPCOMING_BIRTHDAYS: lambda args, book, notebook: show_upcoming_birthdays(args, book),
+    Command.SET_EMAIL: lambda args, book, notebook: add_email(args, book),
+    Command.DELETE_EMAIL: lambda args, book, notebook: delete_email(args, book),
+    Command.SHOW_EMAIL: lambda args, book, notebook: show_email(args, book),
+    Command.ADD_NOTE: lambda args, book, notebook: add_note(args, notebook),
+    Command.LIST_NOTES: lambda args, book, notebook: list_notes(args, notebook),
+    Command.SEARCH_NOTES: lambda args, book, notebook: search_notes(args, notebook),
+    Command.SEARCH_TAGS: lambda args, book, notebook: search_notes_by_tags(args, notebook),
+    Command.EDIT_NOTE: lambda args, book, notebook: edit_note(args, notebook),
+    Command.DELETE_NOTE: lambda args, book, notebook: delete_note(args, notebook),
+    Command.SET_ADDRESS: lambda args, book, notebook: add_address(args, book),
+    Command.DELETE_ADDRESS: lambda args, book, notebook: remove_address(args, book),
+    Command.SHOW_ADDRESS: lambda args, book, notebook: show_address(args, book),
+    Command.STATS: lambda args, book, notebook: show_statistics(book, notebook),
+    Command.HELP: lambda args, book, notebook: get_help_output(args),
+    Command.HELP_ALT: lambda args, book, notebook: get_help_output(args),
+}
+
+
 def get_output_by_command(command, args, book, notebook):
     """
     Process command and return result.
@@ -91,64 +123,12 @@ def get_output_by_command(command, args, book, notebook):
     Returns:
         tuple: (command output, whether to exit the program)
     """
-    is_break_main_loop = False
-    command_output = None
     if command in (Command.EXIT_1, Command.EXIT_2):
-        is_break_main_loop = True
-        command_output = get_goodbye_message()
-    elif command == Command.HELLO:
-        command_output = "How can I help you?"
-    elif command == Command.ADD_CONTACT:
-        command_output = add_contact(args, book)
-    elif command == Command.UPDATE_CONTACT:
-        command_output = update_contact(args, book)
-    elif command == Command.SHOW_ALL_CONTACTS:
-        command_output = get_all_contacts(book)
-    elif command == Command.SEARCH_CONTACTS:
-        command_output = search_contacts(args, book)
-    elif command == Command.SHOW_CONTACT:
-        command_output = get_one_contact(args, book)
-    elif command == Command.DELETE_CONTACT:
-        command_output = delete_contact(args, book)
-    elif command == Command.SET_BIRTHDAY:
-        command_output = add_birthday(args, book)
-    elif command == Command.SHOW_BIRTHDAY:
-        command_output = show_birthday(args, book)
-    elif command == Command.DELETE_BIRTHDAY:
-        command_output = delete_birthday(args, book)
-    elif command == Command.SHOW_UPCOMING_BIRTHDAYS:
-        command_output = show_upcoming_birthdays(args, book)
-    elif command == Command.SET_EMAIL:
-        command_output = add_email(args, book)
-    elif command == Command.DELETE_EMAIL:
-        command_output = delete_email(args, book)
-    elif command == Command.SHOW_EMAIL:
-        command_output = show_email(args, book)
-    elif command == Command.ADD_NOTE:
-        command_output = add_note(args, notebook)
-    elif command == Command.LIST_NOTES:
-        command_output = list_notes(args, notebook)
-    elif command == Command.SEARCH_NOTES:
-        command_output = search_notes(args, notebook)
-    elif command == Command.SEARCH_TAGS:
-        command_output = search_notes_by_tags(args, notebook)
-    elif command == Command.EDIT_NOTE:
-        command_output = edit_note(args, notebook)
-    elif command == Command.DELETE_NOTE:
-        command_output = delete_note(args, notebook)
-    elif command == Command.SET_ADDRESS:
-        command_output = add_address(args, book)
-    elif command == Command.DELETE_ADDRESS:
-        command_output = remove_address(args, book)
-    elif command == Command.SHOW_ADDRESS:
-        command_output = show_address(args, book)
-    elif command in Command.STATS:
-        command_output = show_statistics(book, notebook)
-    elif command in [Command.HELP, Command.HELP_ALT]:
-        command_output = get_help_output(args)
-    else:
-        command_output = "Unknown command. Please try again."
-    return command_output, is_break_main_loop
+        return get_goodbye_message(), True
+    handler = _COMMAND_HANDLERS.get(command)
+    if handler is None:
+        return "Unknown command. Please try again.", False
+    return handler(args, book, notebook), False
 
 
 def _get_unknown_category_message(category):
@@ -17,6 +17,7 @@ class Address(Field):
     Attributes:
         value (str): The address text
     """
+    __slots__ = ()
 
     def __init__(self, value):
         """
@@ -32,6 +32,17 @@ class AddressBook(UserDict):
         """
         self.data[record.name.value] = record
 
+    def extend(self, records):
+        """
+        Add several contact records to the address book at once.
+
+        Later records replace earlier ones with the same name, as with add_record.
+
+        Args:
+            records (Iterable[Record]): Contact records to add
+        """
+        self.data.update({record.name.value: record for record in records})
+
     def delete(self, name):
         """
         Delete a contact from the address book.
@@ -5,7 +5,8 @@ This module provides the Birthday class for storing and validating
 birthday dates in the address book system.
 """
 
-from datetime import datetime
+import re
+from datetime import date
 from colorama import Fore, Style
 from .field import Field
 
@@ -23,8 +24,10 @@ class Birthday(Field):
     Attributes:
         value (date): The validated birthday date
     """
+    __slots__ = ()
     DATE_FORMAT = "%d.%m.%Y"
     DATE_FORMAT_DISPLAY = "DD.MM.YYYY"
+    DATE_PATTERN = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", re.ASCII)
 
     def __init__(self, value: str):
         """
@@ -37,11 +40,35 @@ class Birthday(Field):
             ValueError: If date format is invalid
         """
         try:
-            date_value = datetime.strptime(value, Birthday.DATE_FORMAT).date()
+            date_value = Birthday._parse_date(value)
             super().__init__(date_value)
         except ValueError:
             raise ValueError(f"Invalid date format. Use {Fore.MAGENTA}{Birthday.DATE_FORMAT_DISPLAY}{Style.RESET_ALL} format.")
 
+    @staticmethod
+    def _parse_date(value: str) -> date:
+        """
+        Parse a DD.MM.YYYY string into a date.
+
+        The whole string must match DATE_PATTERN: a one or two digit day and
+        month and a four digit year, ASCII digits only, separated by dots and
+        with no surrounding whitespace.
+
+        Args:
+            value (str): Date string to parse
+
+        Returns:
+            date: Parsed date
+
+        Raises:
+            ValueError: If the string is not a valid DD.MM.YYYY date
+        """
+        match = Birthday.DATE_PATTERN.fullmatch(value)
+        if match is None:
+            raise ValueError(f"Date '{value}' does not match {Birthday.DATE_FORMAT_DISPLAY}")
+        day, month, year = match.groups()
+        return date(int(year), int(month), int(day))
+
     def __str__(self):
         """
         Return string representation of the birthday.
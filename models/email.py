@@ -18,6 +18,7 @@ class Email(Field):
     Attributes:
         value (str): The validated email address
     """
+    __slots__ = ()
     EMAIL_PATTERN = re.compile(
         r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     )
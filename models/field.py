@@ -16,6 +16,7 @@ class Field:
     Attributes:
         value: The stored value of the field
     """
+    __slots__ = ("value",)
 
     def __init__(self, value):
         """
@@ -34,3 +35,19 @@ class Field:
             str: String representation of the value
         """
         return str(self.value)
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled field.
+
+        Fields pickled before __slots__ was introduced carry a plain attribute
+        dict; slotted fields carry a (dict_state, slot_state) tuple.
+
+        Args:
+            state (dict | tuple): Pickled field state
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        for name, value in state.items():
+            setattr(self, name, value)
@@ -17,6 +17,7 @@ class Name(Field):
     Attributes:
         value (str): The validated name
     """
+    __slots__ = ()
 
     def __init__(self, value):
         """
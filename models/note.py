@@ -3,6 +3,11 @@ from datetime import datetime
 
 
 class Note:
+    __slots__ = (
+        "_uuid", "_text", "_text_lower", "_tags", "_tags_lower", "_tag_set",
+        "created_at", "updated_at",
+    )
+
     def __init__(self, text, tags=None):
         """
         Initializes a new note.
@@ -41,6 +46,54 @@ class Note:
 
         return f"{self.text} | Tags: {tags_str}"
 
+    def __setstate__(self, state):
+        """
+        Restores a pickled note, rebuilding the lowercase search caches.
+
+        Notes saved before the caches existed store plain "text" and "tags"
+        attributes; those are routed through the property setters. Notes
+        saved before __slots__ carry a plain dict; slotted notes carry a
+        (dict_state, slot_state) tuple.
+
+        Args:
+            state (dict | tuple): Pickled instance attributes
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        state = dict(state)
+        text = state.pop("text", state.get("_text"))
+        tags = state.pop("tags", state.get("_tags"))
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.text = text
+        self.tags = tags
+
+    @property
+    def text(self):
+        """str: Note text."""
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+        self._text_lower = value.lower()
+
+    @property
+    def tags(self):
+        """list: Note tags in display order."""
+        return self._tags
+
+    @tags.setter
+    def tags(self, value):
+        self._tags = value
+        self._refresh_tags()
+
+    def _refresh_tags(self):
+        """Rebuilds the lowercase tag caches used by searches."""
+        self._tags_lower = tuple(str(tag).lower() for tag in self._tags)
+        self._tag_set = frozenset(self._tags_lower)
+
     def add_tag(self, tag):
         """
         Adds a tag to the note.
@@ -50,6 +103,7 @@ class Note:
         """
         if tag not in self.tags:
             self.tags.append(tag)
+            self._refresh_tags()
             self.updated_at = datetime.now()
 
     def remove_tag(self, tag):
@@ -61,6 +115,7 @@ class Note:
         """
         if tag in self.tags:
             self.tags.remove(tag)
+            self._refresh_tags()
             self.updated_at = datetime.now()
 
     def edit_tags(self, new_tags):
@@ -1,11 +1,14 @@
 """Notebook model for managing notes with tags and search functionality."""
 
+import heapq
 from typing import Optional
 from models.note import Note
 
 
 class NoteBook:
     """Notebook class for managing notes with tags and search functionality."""
+    WRONG_TYPE_MESSAGE = "Only Note objects can be added to the notebook"
+
     def __init__(self):
         """
         Initializes a new notebook.
@@ -32,7 +35,7 @@ class NoteBook:
             TypeError: If note is not an instance of Note
         """
         if not isinstance(note, Note):
-            raise TypeError("Only Note objects can be added to the notebook")
+            raise TypeError(NoteBook.WRONG_TYPE_MESSAGE)
 
         already_exists = note._uuid in self.notes
         self.notes[note._uuid] = note
@@ -77,19 +80,28 @@ class NoteBook:
             else:
                 reverse = True  # Default to descending (newest first) for created/updated
 
-        if sort_by == "created":
-            return sorted(notes_list, key=lambda n: n.created_at, reverse=reverse)
-        elif sort_by == "updated":
-            return sorted(notes_list, key=lambda n: n.updated_at, reverse=reverse)
+        return sorted(notes_list, key=self._sort_key(sort_by), reverse=reverse)
+
+    @staticmethod
+    def _sort_key(sort_by: str):
+        """
+        Returns the key function for a sorting method.
+
+        Args:
+            sort_by (str): Sorting method - "created", "updated", "text", or "tags"
+
+        Returns:
+            Callable[[Note], Any]: Key function; unknown methods sort by creation time
+        """
+        if sort_by == "updated":
+            return lambda n: n.updated_at
         elif sort_by == "text":
-            return sorted(notes_list, key=lambda n: n.text.lower(), reverse=reverse)
+            return lambda n: n._text_lower
         elif sort_by == "tags":
-            return sorted(notes_list, key=lambda n: (
-                n.tags[0].lower() if n.tags else "\uffff"
-            ), reverse=reverse)
+            return lambda n: n.tags[0].lower() if n.tags else "\uffff"
         else:
-            # Default to created
-            return sorted(notes_list, key=lambda n: n.created_at, reverse=reverse)
+            # "created" and the default
+            return lambda n: n.created_at
 
     def get_note_by_number(self, number: int, sort_by: str = "created", reverse: bool = None) -> Optional[Note]:
         """
@@ -110,11 +122,12 @@ class NoteBook:
                 reverse = False  # Default to ascending (A-Z) for text/tags
             else:
                 reverse = True  # Default to descending (newest first) for created/updated
-        notes_list = self.get_all_notes(sort_by, reverse=reverse)
+        if not 1 <= number <= len(self.notes):
+            return None
 
-        if 1 <= number <= len(notes_list):
-            return notes_list[number - 1]
-        return None
+        # Partial selection: only the first `number` notes need ordering
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(number, self.notes.values(), key=self._sort_key(sort_by))[-1]
 
     def get_note_id_by_number(self, number: int, sort_by: str = "created", reverse: bool = None) -> Optional[str]:
         """
@@ -147,7 +160,7 @@ class NoteBook:
         text_lower = text_fragment.lower()
 
         for note in self.notes.values():
-            if text_lower in note.text.lower():
+            if text_lower in note._text_lower:
                 return note
         return None
 
@@ -166,13 +179,13 @@ class NoteBook:
 
         for note in self.notes.values():
             # Check if query is in text
-            if query_lower in note.text.lower():
+            if query_lower in note._text_lower:
                 results.append(note)
                 continue
 
             # Check if query matches any tag
-            for tag in note.tags:
-                if query_lower in str(tag).lower():
+            for tag in note._tags_lower:
+                if query_lower in tag:
                     results.append(note)
                     break
 
@@ -191,17 +204,10 @@ class NoteBook:
         if not tags:
             return []
 
-        results = []
-        tags_lower = [str(tag).lower() for tag in tags]
-
-        for note in self.notes.values():
-            note_tags_lower = [str(tag).lower() for tag in note.tags]
-
-            # Check if all search tags are in note tags
-            if all(tag in note_tags_lower for tag in tags_lower):
-                results.append(note)
+        tags_lower = frozenset(str(tag).lower() for tag in tags)
 
-        return results
+        # Keep notes whose tag set contains all search tags
+        return [note for note in self.notes.values() if tags_lower <= note._tag_set]
 
     def __len__(self) -> int:
         """
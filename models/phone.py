@@ -5,6 +5,7 @@ This module provides the Phone class for storing and validating
 phone numbers in the address book system.
 """
 import re
+from functools import lru_cache
 from .field import Field
 
 
@@ -17,8 +18,10 @@ class Phone(Field):
     Attributes:
         value (str): The validated phone number
     """
+    __slots__ = ()
     PHONE_LEN = 10
     EMPTY_PHONE = ""
+    NON_DIGIT_PATTERN = re.compile(r"\D")
 
     def __init__(self, value):
         """
@@ -30,8 +33,33 @@ class Phone(Field):
         Raises:
             ValueError: If phone number is not 10 digits or contains non-numeric characters
         """
-        # Clean the phone number (remove all non-digit characters)
-        phone = re.sub(r"\D", "", value)
+        super().__init__(Phone.normalize(value))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def normalize(value: str) -> str:
+        """
+        Clean and validate a phone number without creating a Phone.
+
+        Results are memoized, so numbers that are looked up or re-entered
+        repeatedly are validated once. Invalid input is never cached and
+        raises on every call.
+
+        Args:
+            value (str): Phone number in any format
+
+        Returns:
+            str: The 10 digits of the phone number
+
+        Raises:
+            ValueError: If phone number is not 10 digits or contains non-numeric characters
+        """
+        # Already normalized input (isdecimal matches exactly what \d keeps) skips cleaning
+        if len(value) == Phone.PHONE_LEN and value.isdecimal():
+            phone = value
+        else:
+            # Clean the phone number (remove all non-digit characters)
+            phone = Phone.NON_DIGIT_PATTERN.sub("", value)
 
         if phone == Phone.EMPTY_PHONE:
             raise ValueError("Phone number cannot be empty")
@@ -39,4 +67,29 @@ class Phone(Field):
         if not (phone.isdigit() and len(phone) == Phone.PHONE_LEN):
             raise ValueError(f"""Phone number must be {Phone.PHONE_LEN} digits and contain only digits""")
 
-        super().__init__(phone)
+        return phone
+
+    def __eq__(self, other):
+        """
+        Compare with another Phone or with a normalized phone string.
+
+        Args:
+            other (Phone | str): Value to compare with
+
+        Returns:
+            bool: True if the stored digits are equal
+        """
+        if isinstance(other, Phone):
+            return self.value == other.value
+        if isinstance(other, str):
+            return self.value == other
+        return NotImplemented
+
+    def __hash__(self):
+        """
+        Return a hash consistent with __eq__.
+
+        Returns:
+            int: Hash of the stored digits
+        """
+        return hash(self.value)
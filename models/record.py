@@ -25,6 +25,7 @@ class Record:
         address (Address, optional): Contact's address
         birthday (Birthday, optional): Contact's birthday
     """
+    __slots__ = ("name", "phones", "email", "birthday", "address")
 
     def __init__(self, name):
         """
@@ -39,6 +40,26 @@ class Record:
         self.birthday = None
         self.address = None
 
+    def __setstate__(self, state):
+        """
+        Restore a pickled record.
+
+        Records pickled before __slots__ was introduced carry a plain attribute
+        dict, possibly without the later email/address fields; slotted records
+        carry a (dict_state, slot_state) tuple.
+
+        Args:
+            state (dict | tuple): Pickled record state
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        self.email = None
+        self.birthday = None
+        self.address = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __str__(self):
         """
         Return string representation of the contact.
@@ -75,14 +96,10 @@ class Record:
         Raises:
             ValueError: If old phone number is not found or new phone format is invalid
         """
-        phone = self.find_phone(old_phone)
-        if not phone:
+        idx = self._find_phone_index(old_phone)
+        if idx is None:
             raise ValueError(f"Phone {old_phone} not found")
-        for idx, phone in enumerate(self.phones):
-            if phone.value == old_phone:
-                self.phones[idx] = Phone(new_phone)
-                return
-        raise ValueError(f"Phone {old_phone} not found")
+        self.phones[idx] = Phone(new_phone)
 
     def delete_phone(self, phone_number):
         """
@@ -91,9 +108,9 @@ class Record:
         Args:
             phone_number (str): Phone number to delete
         """
-        phone = self.find_phone(phone_number)
-        if phone:
-            self.phones.remove(phone)
+        idx = self._find_phone_index(phone_number)
+        if idx is not None:
+            del self.phones[idx]
 
     def find_phone(self, phone):
         """
@@ -105,12 +122,29 @@ class Record:
         Returns:
             Phone or None: Phone object if found, None otherwise
         """
+        idx = self._find_phone_index(phone)
+        return self.phones[idx] if idx is not None else None
 
-        phone_to_search = Phone(phone)
+    def _find_phone_index(self, phone):
+        """
+        Find the position of a phone number in the contact's phone list.
 
-        for phone_number in self.phones:
-            if phone_number.value == phone_to_search.value:
-                return phone_number
+        The lookup value is validated and normalized once, then compared
+        against the stored digit strings.
+
+        Args:
+            phone (str): Phone number to find
+
+        Returns:
+            int or None: Index in the phone list if found, None otherwise
+
+        Raises:
+            ValueError: If phone number format is invalid
+        """
+        target = Phone.normalize(phone)
+        for idx, phone_number in enumerate(self.phones):
+            if phone_number.value == target:
+                return idx
         return None
 
     def add_email(self, email):
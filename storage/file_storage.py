@@ -12,7 +12,7 @@ def save_data(book, filename="addressbook.pkl"):
         filename (str): Name of the file to save to
     """
     with open(filename, "wb") as f:
-        pickle.dump(book, f)
+        pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_data(filename="addressbook.pkl"):
@@ -41,7 +41,7 @@ def save_notes(notebook: NoteBook, filename="notes.pkl"):
         filename (str): Name of the file to save to
     """
     with open(filename, "wb") as f:
-        pickle.dump(notebook, f)
+        pickle.dump(notebook, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_notes(filename="notes.pkl"):
@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the core handler tests.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from models.address_book import AddressBook
+from models.notebook import NoteBook
+from models.birthday import Birthday
+from models.record import Record
+
+
+@pytest.fixture
+def book():
+    """Return an empty address book."""
+    return AddressBook()
+
+
+@pytest.fixture
+def notebook():
+    """Return an empty notebook."""
+    return NoteBook()
+
+
+@pytest.fixture
+def john_record(book):
+    """Return a "John Doe" record already added to the book fixture."""
+    record = Record("John Doe")
+    book.add_record(record)
+    return record
+
+
+@pytest.fixture
+def calendar():
+    """
+    Return today's date with on-demand offsets for birthday tests.
+
+    Function-scoped so "today" is read when each test runs, matching the
+    clock the birthday handlers use. Only the offsets a test asks for are
+    computed: "date"(days) returns the date that many days from today and
+    "plus"(days) returns it formatted as DD.MM.YYYY.
+    """
+    today = date.today()
+
+    def offset(days):
+        return today + timedelta(days=days)
+
+    return {
+        "today": today,
+        "date": offset,
+        "plus": lambda days: offset(days).strftime(Birthday.DATE_FORMAT),
+    }
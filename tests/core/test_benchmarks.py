@@ -0,0 +1,50 @@
+"""
+Benchmarks for the handlers module.
+
+Timing is disabled by default (see pytest.ini), so these run once as plain
+tests. Measure them with:
+
+    pytest tests/core/test_benchmarks.py --benchmark-enable --benchmark-only
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from core.handlers import add_note, show_statistics
+from models.address_book import AddressBook
+from models.notebook import NoteBook
+from tests.helpers import make_record
+
+CONTACTS = 1000
+NOTES = 1000
+
+
+@pytest.fixture(scope="module")
+def large_data():
+    """Return an address book and notebook with CONTACTS contacts and NOTES notes."""
+    book = AddressBook()
+    today = date.today()
+    for i in range(CONTACTS):
+        birthday = (today + timedelta(days=i % 365)).replace(year=1992)
+        make_record(
+            f"Contact {i}",
+            phones=[f"{i:010d}"],
+            email=f"contact{i}@example.com",
+            birthday=birthday.strftime("%d.%m.%Y"),
+            book=book,
+        )
+
+    notebook = NoteBook()
+    for i in range(NOTES):
+        add_note([f"Note {i}", f"tag{i % 50},tag{i % 7}"], notebook)
+
+    return book, notebook
+
+
+def test_statistics_benchmark(benchmark, large_data):
+    """Benchmark show_statistics on a large address book and notebook."""
+    book, notebook = large_data
+    result = benchmark(show_statistics, book, notebook)
+    assert f"{CONTACTS}" in result
+    assert "TOP 3 TAGS" in result
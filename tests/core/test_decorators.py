@@ -4,6 +4,8 @@ Tests for the decorators module.
 This module contains tests for the input_error decorator functionality.
 """
 
+import pytest
+
 from core.decorators import input_error
 
 
@@ -92,8 +94,5 @@ def test_input_error_unhandled_exception():
     def test_func():
         raise RuntimeError("Unhandled error")
 
-    try:
+    with pytest.raises(RuntimeError, match="Unhandled error"):
         test_func()
-        assert False, "Expected RuntimeError to be raised"
-    except RuntimeError as e:
-        assert "Unhandled error" in str(e)
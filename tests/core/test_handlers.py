@@ -4,9 +4,9 @@ Tests for the handlers module.
 This module contains tests for all handler functions in the address book bot.
 """
 
-from datetime import date, timedelta
 import time
-from unittest.mock import patch
+import pytest
+import models.note
 from core.handlers import (
     add_contact,
     update_contact,
@@ -27,75 +27,60 @@ from core.handlers import (
     delete_email,
     show_email,
     show_statistics,
+    compute_statistics,
+    render_statistics,
 )
-from models.address_book import AddressBook
 from models.notebook import NoteBook
 from models.record import Record
+from tests.helpers import assert_notes_found, make_fast_clock, make_record
+
+# A leap year, so a calendar offset landing on 29 February is still a valid birthday
+BIRTH_YEAR = 1992
+# Formats a date's day and month with another year as DD.MM.YYYY
+_birthday_in_year = "{0.day:02d}.{0.month:02d}.{1}".format
 
 
 class TestAddContact:
     """Test suite for the add_contact handler."""
 
-    def test_add_new_contact(self):
-        """Test adding a new contact."""
-        book = AddressBook()
-        result = add_contact(["John Doe", "1234567890"], book)
-        assert "added successfully" in result.lower()
-        assert "John Doe" in book.data
-
-    def test_update_existing_contact_with_phone(self):
-        """Test adding phone to existing contact."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
-        result = add_contact(["John Doe", "1234567890"], book)
-        assert "updated successfully" in result.lower()
-        assert len(record.phones) == 1
-
-    def test_add_contact_invalid_phone(self):
-        """Test adding contact with invalid phone."""
-        book = AddressBook()
-        result = add_contact(["John Doe", "123"], book)
-        assert "Phone number must be 10 digits" in result
-
-    def test_add_contact_duplicate_phone(self):
-        """Test adding duplicate phone number to existing contact."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_phone("1234567890")
-        book.add_record(record)
-        result = add_contact(["John Doe", "1234567890"], book)
-        assert "already exists" in result.lower()
+    @pytest.mark.parametrize("args, preload_phones, expected, phone_count", [
+        # New contact
+        (["John Doe", "1234567890"], None, "added successfully", 1),
+        # Phone added to an existing contact
+        (["John Doe", "1234567890"], [], "updated successfully", 1),
+        # Invalid phone
+        (["John Doe", "123"], None, "phone number must be 10 digits", 0),
+        # Duplicate phone on an existing contact
+        (["John Doe", "1234567890"], ["1234567890"], "already exists", 1),
+    ])
+    def test_add_contact(self, book, args, preload_phones, expected, phone_count):
+        """Test add_contact messages and stored phones for each input case."""
+        if preload_phones is not None:
+            make_record("John Doe", phones=preload_phones, book=book)
+        result = add_contact(args, book)
+        assert expected in result.lower()
+        assert len(book.data["John Doe"].phones) == phone_count
 
 
 class TestUpdateContact:
     """Test suite for the update_contact handler."""
 
-    def test_update_contact_phone(self):
+    def test_update_contact_phone(self, book):
         """Test updating a contact's phone number."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_phone("1234567890")
-        book.add_record(record)
+        record = make_record("John Doe", phones=["1234567890"], book=book)
         result = update_contact(["John Doe", "1234567890", "9876543210"], book)
         assert "updated" in result.lower()
-        assert record.phones[0].value == "9876543210"
+        assert record.phones[0] == "9876543210"
 
-    def test_update_contact_phone_not_found(self):
+    def test_update_contact_phone_not_found(self, book):
         """Test updating non-existent phone."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_phone("1234567890")
-        book.add_record(record)
+        make_record("John Doe", phones=["1234567890"], book=book)
         result = update_contact(["John Doe", "9999999999", "1111111111"], book)
         assert "not found" in result.lower()
 
-    def test_update_contact_invalid_new_phone(self):
+    def test_update_contact_invalid_new_phone(self, book):
         """Test updating with invalid new phone format."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_phone("1234567890")
-        book.add_record(record)
+        make_record("John Doe", phones=["1234567890"], book=book)
         result = update_contact(["John Doe", "1234567890", "123"], book)
         assert "Phone number must be 10 digits" in result
 
@@ -103,9 +88,8 @@ class TestUpdateContact:
 class TestGetAllContacts:
     """Test suite for the get_all_contacts handler."""
 
-    def test_get_all_contacts_empty_book(self):
+    def test_get_all_contacts_empty_book(self, book):
         """Test getting all contacts from empty book."""
-        book = AddressBook()
         result = get_all_contacts(book)
         assert "No contacts found" in result
 
@@ -124,22 +108,16 @@ class TestGetAllContacts:
 class TestGetOneContact:
     """Test suite for the get_one_contact handler."""
 
-    def test_get_one_contact_with_phones(self):
+    def test_get_one_contact_with_phones(self, book, john_record):
         """Test getting a specific contact."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_phone("1234567890")
-        record.add_phone("0987654321")
-        book.add_record(record)
+        john_record.add_phone("1234567890")
+        john_record.add_phone("0987654321")
         result = get_one_contact(["John Doe"], book)
         assert "John Doe" in result
         assert "(123)456-7890" in result
 
-    def test_get_one_contact_no_phones(self):
+    def test_get_one_contact_no_phones(self, book, john_record):
         """Test getting contact without phones."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
         result = get_one_contact(["John Doe"], book)
         assert "John Doe" in result
         assert "no phones" in result
@@ -148,20 +126,15 @@ class TestGetOneContact:
 class TestDeleteContact:
     """Test suite for the delete_contact handler."""
 
-    @patch('core.handlers.confirm_delete')
-    def test_delete_existing_contact(self, mock_confirm):
+    def test_delete_existing_contact(self, book, john_record, mocker):
         """Test deleting an existing contact."""
-        mock_confirm.return_value = True
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
         result = delete_contact(["John Doe"], book)
         assert "deleted" in result.lower()
         assert "John Doe" not in book.data
 
-    def test_delete_non_existing_contact(self):
+    def test_delete_non_existing_contact(self, book):
         """Test deleting non-existing contact raises error."""
-        book = AddressBook()
         result = delete_contact(["Jane Doe"], book)
         assert "not found" in result
 
@@ -169,20 +142,14 @@ class TestDeleteContact:
 class TestAddBirthday:
     """Test suite for the add_birthday handler."""
 
-    def test_add_birthday_to_contact(self):
+    def test_add_birthday_to_contact(self, book, john_record):
         """Test adding birthday to a contact."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
         result = add_birthday(["John Doe", "15.03.1990"], book)
         assert "Birthday added" in result
-        assert record.birthday is not None
+        assert john_record.birthday is not None
 
-    def test_add_invalid_birthday_format(self):
+    def test_add_invalid_birthday_format(self, book, john_record):
         """Test adding birthday with invalid format."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
         result = add_birthday(["John Doe", "1990-03-15"], book)
         # Decoration catches the error and returns a generic message
         assert (
@@ -194,21 +161,15 @@ class TestAddBirthday:
 class TestShowBirthday:
     """Test suite for the show_birthday handler."""
 
-    def test_show_birthday_with_birthday(self):
+    def test_show_birthday_with_birthday(self, book, john_record):
         """Test showing birthday for contact with birthday."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_birthday("15.03.1990")
-        book.add_record(record)
+        john_record.add_birthday("15.03.1990")
         result = show_birthday(["John Doe"], book)
         assert "birthday is" in result
         assert "15.03.1990" in result
 
-    def test_show_birthday_without_birthday(self):
+    def test_show_birthday_without_birthday(self, book, john_record):
         """Test showing birthday for contact without birthday."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
         result = show_birthday(["John Doe"], book)
         assert "no birthday set" in result
 
@@ -216,33 +177,26 @@ class TestShowBirthday:
 class TestBirthdays:
     """Test suite for the birthdays handler."""
 
-    def test_no_upcoming_by_default(self):
+    def test_no_upcoming_by_default(self, book):
         """Test birthdays when the contacts book is empty."""
-        book = AddressBook()
         result = show_upcoming_birthdays([], book)
         assert "birthdays" in result.lower() and "7" in result
 
-    def test_birthdays_no_upcoming(self):
+    def test_birthdays_no_upcoming(self, book):
         """Test birthdays when no upcoming birthdays."""
-        book = AddressBook()
         result = show_upcoming_birthdays(["8"], book)
         assert "birthdays" in result.lower() and "8" in result
 
-    def test_custom_days_argument_finds_upcoming(self):
+    def test_custom_days_argument_finds_upcoming(self, book, john_record, calendar):
         """Test birthdays for specific days ahead."""
-        book = AddressBook()
-        today = date.today()
-        future_birthday = (today + timedelta(days=3)).strftime("%d.%m.%Y")
-        record = Record("John Doe")
-        record.add_birthday(future_birthday)
-        book.add_record(record)
+        future_birthday = calendar["plus"](3)
+        john_record.add_birthday(future_birthday)
 
         result = show_upcoming_birthdays(["5"], book)
         assert "John Doe" in result
 
-    def test_invalid_days_argument_returns_error_message(self):
+    def test_invalid_days_argument_returns_error_message(self, book):
         """Test birthdays when specific days ahead is not a number."""
-        book = AddressBook()
         result = show_upcoming_birthdays(["not_a_number"], book)
         assert "Please input valid number" in result
 
@@ -329,81 +283,70 @@ class TestParseTags:
 class TestAddNote:
     """Test suite for the add_note handler."""
 
-    def test_add_note_text_only(self):
+    def test_add_note_text_only(self, notebook):
         """Test adding a note with text only."""
-        notebook = NoteBook()
         result = add_note(["Test note"], notebook)
         assert "#1" in result and "added" in result
         assert len(notebook) == 1
 
-    def test_add_note_with_single_tag(self):
+    def test_add_note_with_single_tag(self, notebook):
         """Test adding a note with a single tag."""
-        notebook = NoteBook()
         result = add_note(["Test note", "important"], notebook)
         assert "#1" in result and "added" in result
         assert "important" in result
         assert len(notebook) == 1
 
-    def test_add_note_with_multiple_tags(self):
+    def test_add_note_with_multiple_tags(self, notebook):
         """Test adding a note with multiple tags."""
-        notebook = NoteBook()
         result = add_note(["Test note", "tag1,tag2,tag3"], notebook)
         assert "#1" in result and "added" in result
         assert "tag1" in result or "tags:" in result
 
-    def test_add_note_with_space_separated_tags(self):
+    def test_add_note_with_space_separated_tags(self, notebook):
         """Test adding a note with space-separated tags."""
-        notebook = NoteBook()
         result = add_note(["Test note", "tag1", "tag2", "tag3"], notebook)
         assert "#1" in result and "added" in result
 
-    def test_add_note_empty_args(self):
+    def test_add_note_empty_args(self, notebook):
         """Test adding note with empty args raises error."""
-        notebook = NoteBook()
         result = add_note([], notebook)
-        result_lower = result.lower()
         assert (
-            ("text" in result_lower and "requires" in result_lower)
+            ("text" in result.lower() and "requires" in result.lower())
             or "Enter the argument for the command" in result
         )
 
-    def test_add_note_empty_text(self):
+    def test_add_note_empty_text(self, notebook):
         """Test adding note with empty text."""
-        notebook = NoteBook()
         result = add_note([""], notebook)
         assert (
             "Note text cannot be empty" in result
             or "Enter the argument for the command" in result
         )
 
-    def test_add_note_whitespace_only_text(self):
+    def test_add_note_whitespace_only_text(self, notebook):
         """Test adding note with whitespace-only text."""
-        notebook = NoteBook()
         result = add_note(["   "], notebook)
         assert (
             "Note text cannot be empty" in result
             or "Enter the argument for the command" in result
         )
 
-    def test_add_multiple_notes(self):
+    def test_add_multiple_notes(self, notebook):
         """Test adding multiple notes."""
-        notebook = NoteBook()
         add_note(["First note"], notebook)
         add_note(["Second note"], notebook)
         add_note(["Third note"], notebook)
         assert len(notebook) == 3
 
-    def test_add_note_with_duplicate_tags(self):
+    def test_add_note_with_duplicate_tags(self, notebook):
         """Test that duplicate tags are removed."""
-        notebook = NoteBook()
         result = add_note(["Test note", "tag1,tag1,tag2"], notebook)
         assert "#1" in result and "added" in result
         notes = notebook.get_all_notes()
         assert len(notes[0].tags) == 2
 
-    def test_add_note_with_empty_tags(self):
+    def test_add_note_with_empty_tags(self, notebook):
         """Test adding note with empty tag strings."""
-        notebook = NoteBook()
         result = add_note(["Test note", ",,"], notebook)
         assert "#1" in result and "added" in result
 
@@ -411,9 +354,8 @@ class TestAddNote:
 class TestSearchNotes:
     """Test suite for the search_notes handler."""
 
-    def test_search_notes_by_text(self):
+    def test_search_notes_by_text(self, notebook):
         """Test searching notes by text."""
-        notebook = NoteBook()
         add_note(["Buy groceries"], notebook)
         add_note(["Call mom"], notebook)
         add_note(["Buy tickets"], notebook)
@@ -422,9 +364,8 @@ class TestSearchNotes:
         assert "2 note(s)" in result or "2" in result
         assert "groceries" in result or "tickets" in result
 
-    def test_search_notes_by_tag(self):
+    def test_search_notes_by_tag(self, notebook):
         """Test searching notes by tag."""
-        notebook = NoteBook()
         add_note(["Note 1", "important"], notebook)
         add_note(["Note 2", "urgent"], notebook)
         add_note(["Note 3", "important"], notebook)
@@ -432,48 +373,42 @@ class TestSearchNotes:
         result = search_notes(["important"], notebook)
         assert "2 note(s)" in result or "2" in result
 
-    def test_search_notes_no_results(self):
+    def test_search_notes_no_results(self, notebook):
         """Test searching with no matching results."""
-        notebook = NoteBook()
         add_note(["Test note"], notebook)
 
         result = search_notes(["nonexistent"], notebook)
-        assert "notes" in result.lower() and "found" in result.lower()
+        assert_notes_found(result)
 
-    def test_search_notes_empty_notebook(self):
+    def test_search_notes_empty_notebook(self, notebook):
         """Test searching in empty notebook."""
-        notebook = NoteBook()
         result = search_notes(["anything"], notebook)
-        assert "notes" in result.lower() and "found" in result.lower()
+        assert_notes_found(result)
 
-    def test_search_notes_empty_query(self):
+    def test_search_notes_empty_query(self, notebook):
         """Test searching with empty query."""
-        notebook = NoteBook()
         result = search_notes([], notebook)
         assert (
             "Search query is required" in result
             or "Enter the argument for the command" in result
         )
 
-    def test_search_notes_case_insensitive(self):
+    def test_search_notes_case_insensitive(self, notebook):
         """Test that search is case-insensitive."""
-        notebook = NoteBook()
         add_note(["IMPORTANT NOTE"], notebook)
 
         result = search_notes(["important"], notebook)
         assert "1 note(s)" in result or "1" in result
 
-    def test_search_notes_partial_match(self):
+    def test_search_notes_partial_match(self, notebook):
         """Test searching with partial text match."""
-        notebook = NoteBook()
         add_note(["Meeting tomorrow at 3pm"], notebook)
 
         result = search_notes(["tomorrow"], notebook)
         assert "1 note(s)" in result or "1" in result
 
-    def test_search_notes_shows_numbers(self):
+    def test_search_notes_shows_numbers(self, notebook):
         """Test that search results show note numbers."""
-        notebook = NoteBook()
         add_note(["Test note 1"], notebook)
         add_note(["Test note 2"], notebook)
 
@@ -484,9 +419,8 @@ class TestSearchNotes:
 class TestSearchNotesByTags:
     """Test suite for the search_notes_by_tags handler."""
 
-    def test_search_by_single_tag(self):
+    def test_search_by_single_tag(self, notebook):
         """Test searching by single tag."""
-        notebook = NoteBook()
         add_note(["Note 1", "important"], notebook)
         add_note(["Note 2", "urgent"], notebook)
         add_note(["Note 3", "important"], notebook)
@@ -494,9 +428,8 @@ class TestSearchNotesByTags:
         result = search_notes_by_tags(["important"], notebook)
         assert "2 note(s)" in result or "2" in result
 
-    def test_search_by_multiple_tags_all_present(self):
+    def test_search_by_multiple_tags_all_present(self, notebook):
         """Test searching by multiple tags - all must be present."""
-        notebook = NoteBook()
         add_note(["Note 1", "important,work"], notebook)
         add_note(["Note 2", "important,personal"], notebook)
         add_note(["Note 3", "important,work,urgent"], notebook)
@@ -504,55 +437,48 @@ class TestSearchNotesByTags:
         result = search_notes_by_tags(["important", "work"], notebook)
         assert "2 note(s)" in result or "2" in result
 
-    def test_search_by_tags_comma_separated(self):
+    def test_search_by_tags_comma_separated(self, notebook):
         """Test searching with comma-separated tags."""
-        notebook = NoteBook()
         add_note(["Note 1", "tag1,tag2"], notebook)
         add_note(["Note 2", "tag1"], notebook)
 
         result = search_notes_by_tags(["tag1,tag2"], notebook)
         assert "1 note(s)" in result or "1" in result
 
-    def test_search_by_tags_no_matches(self):
+    def test_search_by_tags_no_matches(self, notebook):
         """Test searching by tags with no matches."""
-        notebook = NoteBook()
         add_note(["Note", "tag1"], notebook)
 
         result = search_notes_by_tags(["tag2"], notebook)
-        assert "notes" in result.lower() and "found" in result.lower()
+        assert_notes_found(result)
 
-    def test_search_by_tags_empty_args(self):
+    def test_search_by_tags_empty_args(self, notebook):
         """Test searching with empty args."""
-        notebook = NoteBook()
         result = search_notes_by_tags([], notebook)
         assert (
             "tag" in result.lower() and "required" in result.lower()
             or "Enter the argument for the command" in result
         )
 
-    def test_search_by_tags_empty_notebook(self):
+    def test_search_by_tags_empty_notebook(self, notebook):
         """Test searching in empty notebook."""
-        notebook = NoteBook()
         result = search_notes_by_tags(["tag"], notebook)
-        assert "notes" in result.lower() and "found" in result.lower()
+        assert_notes_found(result)
 
-    def test_search_by_tags_case_insensitive(self):
+    def test_search_by_tags_case_insensitive(self, notebook):
         """Test that tag search is case-insensitive."""
-        notebook = NoteBook()
         add_note(["Note", "IMPORTANT"], notebook)
 
         result = search_notes_by_tags(["important"], notebook)
         assert "1 note(s)" in result or "1" in result
 
-    def test_search_by_tags_no_valid_tags(self):
+    def test_search_by_tags_no_valid_tags(self, notebook):
         """Test searching with no valid tags."""
-        notebook = NoteBook()
         result = search_notes_by_tags([",,"], notebook)
         assert "No valid" in result and "tags" in result
 
-    def test_search_by_tags_shows_tag_list(self):
+    def test_search_by_tags_shows_tag_list(self, notebook):
         """Test that search results show searched tags."""
-        notebook = NoteBook()
         add_note(["Note", "tag1,tag2"], notebook)
 
         result = search_notes_by_tags(["tag1", "tag2"], notebook)
@@ -562,9 +488,8 @@ class TestSearchNotesByTags:
 class TestEditNote:
     """Test suite for the edit_note handler."""
 
-    def test_edit_note_by_number(self):
+    def test_edit_note_by_number(self, notebook):
         """Test editing note by number."""
-        notebook = NoteBook()
         add_note(["Original text", "tag1"], notebook)
 
         result = edit_note(["1", "Updated text", "tag2"], notebook)
@@ -573,17 +498,15 @@ class TestEditNote:
         assert notes[0].text == "Updated text"
         assert "tag2" in notes[0].tags
 
-    def test_edit_note_by_text_fragment(self):
+    def test_edit_note_by_text_fragment(self, notebook):
         """Test editing note by text fragment."""
-        notebook = NoteBook()
         add_note(["Original text"], notebook)
 
         result = edit_note(["Original", "Updated text"], notebook)
         assert "updated" in result.lower()
 
-    def test_edit_note_text_only(self):
+    def test_edit_note_text_only(self, notebook):
         """Test editing note text without tags."""
-        notebook = NoteBook()
         add_note(["Original text", "tag1"], notebook)
 
         result = edit_note(["1", "Updated text"], notebook)
@@ -592,48 +515,42 @@ class TestEditNote:
         assert notes[0].text == "Updated text"
         assert len(notes[0].tags) == 0
 
-    def test_edit_note_with_new_tags(self):
+    def test_edit_note_with_new_tags(self, notebook):
         """Test editing note with new tags."""
-        notebook = NoteBook()
         add_note(["Original text"], notebook)
 
         result = edit_note(["1", "Updated text", "new1,new2"], notebook)
         assert "updated" in result.lower()
         assert "new1" in result or "new2" in result
 
-    def test_edit_note_not_found_by_number(self):
+    def test_edit_note_not_found_by_number(self, notebook):
         """Test editing non-existent note by number."""
-        notebook = NoteBook()
         result = edit_note(["99", "New text"], notebook)
         assert "not found" in result
 
-    def test_edit_note_not_found_by_text(self):
+    def test_edit_note_not_found_by_text(self, notebook):
         """Test editing non-existent note by text."""
-        notebook = NoteBook()
         result = edit_note(["nonexistent", "New text"], notebook)
         assert "not found" in result
 
-    def test_edit_note_insufficient_args(self):
+    def test_edit_note_insufficient_args(self, notebook):
         """Test editing with insufficient arguments."""
-        notebook = NoteBook()
         result = edit_note(["1"], notebook)
         assert (
             "identifier" in result.lower() and "text" in result.lower()
             or "Enter the argument for the command" in result
         )
 
-    def test_edit_note_empty_args(self):
+    def test_edit_note_empty_args(self, notebook):
         """Test editing with empty args."""
-        notebook = NoteBook()
         result = edit_note([], notebook)
         assert (
             "identifier" in result.lower() and "text" in result.lower()
             or "Enter the argument for the command" in result
         )
 
-    def test_edit_note_updates_timestamp(self):
+    def test_edit_note_updates_timestamp(self, notebook):
         """Test that editing updates the timestamp."""
-        notebook = NoteBook()
         add_note(["Original text"], notebook)
         notes_before = notebook.get_all_notes()
         original_time = notes_before[0].updated_at
@@ -644,9 +561,8 @@ class TestEditNote:
         notes_after = notebook.get_all_notes()
         assert notes_after[0].updated_at > original_time
 
-    def test_edit_note_with_comma_separated_tags(self):
+    def test_edit_note_with_comma_separated_tags(self, notebook):
         """Test editing with comma-separated tags."""
-        notebook = NoteBook()
         add_note(["Original text"], notebook)
 
         result = edit_note(["1", "Updated", "tag1,tag2,tag3"], notebook)
@@ -656,54 +572,45 @@ class TestEditNote:
 class TestDeleteNote:
     """Test suite for the delete_note handler."""
 
-    @patch('core.handlers.confirm_delete')
-    def test_delete_note_by_number(self, mock_confirm):
+    def test_delete_note_by_number(self, notebook, mocker):
         """Test deleting note by number."""
-        mock_confirm.return_value = True
-        notebook = NoteBook()
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
         add_note(["Test note"], notebook)
 
         result = delete_note(["1"], notebook)
         assert "deleted" in result.lower()
         assert len(notebook) == 0
 
-    @patch('core.handlers.confirm_delete')
-    def test_delete_note_by_text_fragment(self, mock_confirm):
+    def test_delete_note_by_text_fragment(self, notebook, mocker):
         """Test deleting note by text fragment."""
-        mock_confirm.return_value = True
-        notebook = NoteBook()
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
         add_note(["Test note to delete"], notebook)
 
         result = delete_note(["Test"], notebook)
         assert "deleted" in result.lower()
         assert len(notebook) == 0
 
-    def test_delete_note_not_found_by_number(self):
+    def test_delete_note_not_found_by_number(self, notebook):
         """Test deleting non-existent note by number."""
-        notebook = NoteBook()
         result = delete_note(["99"], notebook)
         assert "not found" in result
 
-    def test_delete_note_not_found_by_text(self):
+    def test_delete_note_not_found_by_text(self, notebook):
         """Test deleting non-existent note by text."""
-        notebook = NoteBook()
         result = delete_note(["nonexistent"], notebook)
         assert "not found" in result
 
-    def test_delete_note_empty_args(self):
+    def test_delete_note_empty_args(self, notebook):
         """Test deleting with empty args."""
-        notebook = NoteBook()
         result = delete_note([], notebook)
         assert (
             "identifier" in result.lower()
             or "Enter the argument for the command" in result
         )
 
-    @patch('core.handlers.confirm_delete')
-    def test_delete_note_from_multiple(self, mock_confirm):
+    def test_delete_note_from_multiple(self, notebook, mocker):
         """Test deleting one note from multiple."""
-        mock_confirm.return_value = True
-        notebook = NoteBook()
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
         add_note(["Note 1"], notebook)
         add_note(["Note 2"], notebook)
         add_note(["Note 3"], notebook)
@@ -712,11 +619,9 @@ class TestDeleteNote:
         assert "deleted" in result.lower()
         assert len(notebook) == 2
 
-    @patch('core.handlers.confirm_delete')
-    def test_delete_note_shows_truncated_text(self, mock_confirm):
+    def test_delete_note_shows_truncated_text(self, notebook, mocker):
         """Test that delete confirmation shows truncated text."""
-        mock_confirm.return_value = True
-        notebook = NoteBook()
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
         long_text = "A" * 100
         add_note([long_text], notebook)
 
@@ -727,15 +632,13 @@ class TestDeleteNote:
 class TestListNotes:
     """Test suite for the list_notes handler."""
 
-    def test_list_notes_empty_notebook(self):
+    def test_list_notes_empty_notebook(self, notebook):
         """Test listing notes in empty notebook."""
-        notebook = NoteBook()
         result = list_notes([], notebook)
         assert "No notes found" in result
 
-    def test_list_notes_default_sort(self):
+    def test_list_notes_default_sort(self, notebook):
         """Test listing notes with default sorting."""
-        notebook = NoteBook()
         add_note(["Note 1"], notebook)
         add_note(["Note 2"], notebook)
         add_note(["Note 3"], notebook)
@@ -746,59 +649,52 @@ class TestListNotes:
         assert "Note 2" in result or "2" in result
         assert "Note 3" in result or "3" in result
 
-    def test_list_notes_sort_by_created(self):
+    def test_list_notes_sort_by_created(self, notebook):
         """Test listing notes sorted by creation date."""
-        notebook = NoteBook()
         add_note(["First"], notebook)
         add_note(["Second"], notebook)
 
         result = list_notes(["created"], notebook)
         assert "by creation date" in result
 
-    def test_list_notes_sort_by_updated(self):
+    def test_list_notes_sort_by_updated(self, notebook):
         """Test listing notes sorted by update date."""
-        notebook = NoteBook()
         add_note(["Note"], notebook)
 
         result = list_notes(["updated"], notebook)
         assert "by update date" in result
 
-    def test_list_notes_sort_by_text(self):
+    def test_list_notes_sort_by_text(self, notebook):
         """Test listing notes sorted alphabetically."""
-        notebook = NoteBook()
         add_note(["Zebra"], notebook)
         add_note(["Apple"], notebook)
 
         result = list_notes(["text"], notebook)
         assert "alphabetically" in result
 
-    def test_list_notes_sort_by_tags(self):
+    def test_list_notes_sort_by_tags(self, notebook):
         """Test listing notes sorted by tags."""
-        notebook = NoteBook()
         add_note(["Note", "tag1"], notebook)
 
         result = list_notes(["tags"], notebook)
         assert "by tags" in result
 
-    def test_list_notes_sort_equals_format(self):
+    def test_list_notes_sort_equals_format(self, notebook):
         """Test listing with sort=parameter format."""
-        notebook = NoteBook()
         add_note(["Note"], notebook)
 
         result = list_notes(["sort=text"], notebook)
         assert "All notes" in result
 
-    def test_list_notes_invalid_sort(self):
+    def test_list_notes_invalid_sort(self, notebook):
         """Test listing with invalid sort parameter."""
-        notebook = NoteBook()
         add_note(["Note"], notebook)
 
         result = list_notes(["invalid"], notebook)
         assert "All notes" in result
 
-    def test_list_notes_shows_all_note_info(self):
+    def test_list_notes_shows_all_note_info(self, notebook):
         """Test that listing shows note text and tags."""
-        notebook = NoteBook()
         add_note(["Test note", "tag1,tag2"], notebook)
 
         result = list_notes([], notebook)
@@ -809,11 +705,9 @@ class TestListNotes:
 class TestIntegrationNoteHandlers:
     """Integration tests for note handlers."""
 
-    @patch('core.handlers.confirm_delete')
-    def test_full_workflow(self, mock_confirm):
+    def test_full_workflow(self, notebook, mocker):
         """Test complete workflow with all operations."""
-        mock_confirm.return_value = True
-        notebook = NoteBook()
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
 
         # Add notes
         add_note(["Buy groceries", "shopping,important"], notebook)
@@ -841,9 +735,8 @@ class TestIntegrationNoteHandlers:
         delete_note(["2"], notebook)
         assert len(notebook) == 2
 
-    def test_edge_cases_combination(self):
+    def test_edge_cases_combination(self, notebook):
         """Test combination of edge cases."""
-        notebook = NoteBook()
 
         # Add note with many tags
         add_note(["Important", "tag1,tag2,tag3,tag4,tag5"], notebook)
@@ -853,19 +746,18 @@ class TestIntegrationNoteHandlers:
 
         # Search by old tags should fail
         result = search_notes_by_tags(["tag1"], notebook)
-        assert "notes" in result.lower() and "found" in result.lower()
+        assert_notes_found(result)
 
         # Search by new tags should succeed
         result = search_notes_by_tags(["newtag1"], notebook)
         assert "1 note(s)" in result or "1" in result
 
-    def test_error_handling_sequence(self):
+    def test_error_handling_sequence(self, notebook):
         """Test error handling in sequence of operations."""
-        notebook = NoteBook()
 
         # Try to search in empty notebook
         result = search_notes(["anything"], notebook)
-        assert "notes" in result.lower() and "found" in result.lower()
+        assert_notes_found(result)
 
         # Try to delete non-existent note
         result = delete_note(["1"], notebook)
@@ -886,43 +778,22 @@ class TestIntegrationNoteHandlers:
 class TestAddEmail:
     """Test suite for the add_email handler."""
 
-    def test_add_email_to_existing_contact(self):
+    def test_add_email_to_existing_contact(self, book, john_record):
         """Test adding email to existing contact."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
         result = add_email(["John Doe", "test@example.com"], book)
         assert "added" in result.lower() or "updated" in result.lower()
-        assert record.email is not None
-        assert record.email.value == "test@example.com"
+        assert john_record.email is not None
+        assert john_record.email.value == "test@example.com"
 
-    def test_update_email_to_existing_contact(self):
+    def test_update_email_to_existing_contact(self, book, john_record):
         """Test updating email for existing contact."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_email("old@example.com")
-        book.add_record(record)
+        john_record.add_email("old@example.com")
         result = add_email(["John Doe", "new@example.com"], book)
         assert "updated" in result.lower() or "added" in result.lower()
-        assert record.email.value == "new@example.com"
-
-    def test_add_email_to_nonexistent_contact(self):
-        """Test adding email to non-existent contact."""
-        book = AddressBook()
-        result = add_email(["Nonexistent", "test@example.com"], book)
-        assert "not found" in result.lower()
-
-    def test_add_email_missing_args(self):
-        """Test adding email with missing arguments."""
-        book = AddressBook()
-        result = add_email(["John"], book)
-        assert "Error" in result and "requires" in result.lower()
+        assert john_record.email.value == "new@example.com"
 
-    def test_add_email_invalid_format(self):
+    def test_add_email_invalid_format(self, book, john_record):
         """Test adding email with invalid format."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
         result = add_email(["John Doe", "invalid-email"], book)
         assert "Error" in result or "Invalid email format" in result
 
@@ -930,167 +801,148 @@ class TestAddEmail:
 class TestDeleteEmail:
     """Test suite for the delete_email handler."""
 
-    def test_delete_email(self):
+    def test_delete_email(self, book, john_record):
         """Test deleting email from contact."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_email("test@example.com")
-        book.add_record(record)
+        john_record.add_email("test@example.com")
         result = delete_email(["John Doe"], book)
         assert "removed" in result.lower() or "deleted" in result.lower()
-        assert record.email is None
+        assert john_record.email is None
 
-    def test_delete_email_no_email(self):
+    def test_delete_email_no_email(self, book, john_record):
         """Test deleting email when contact has no email."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
         result = delete_email(["John Doe"], book)
         assert "email" in result.lower() and ("no" in result.lower() or "has no" in result.lower())
 
-    def test_delete_email_not_found(self):
-        """Test deleting email for non-existent contact."""
-        book = AddressBook()
-        result = delete_email(["Nonexistent"], book)
-        assert "not found" in result.lower()
-
-    def test_delete_email_missing_args(self):
-        """Test deleting email with missing arguments."""
-        book = AddressBook()
-        result = delete_email([], book)
-        assert "Error" in result and "requires" in result.lower()
-
 
 class TestShowEmail:
     """Test suite for the show_email handler."""
 
-    def test_show_email_with_email(self):
+    def test_show_email_with_email(self, book, john_record):
         """Test showing contact with email."""
-        book = AddressBook()
-        record = Record("John Doe")
-        record.add_email("test@example.com")
-        book.add_record(record)
+        john_record.add_email("test@example.com")
         result = show_email(["John Doe"], book)
         assert "test@example.com" in result
 
-    def test_show_email_no_email(self):
+    def test_show_email_no_email(self, book, john_record):
         """Test showing contact without email."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
         result = show_email(["John Doe"], book)
         assert "no email" in result.lower()
 
-    def test_show_email_not_found(self):
-        """Test showing email for non-existent contact."""
-        book = AddressBook()
-        result = show_email(["Nonexistent"], book)
-        assert "not found" in result.lower()
 
-    def test_show_email_missing_args(self):
-        """Test showing email with missing arguments."""
-        book = AddressBook()
-        result = show_email([], book)
+class TestEmailHandlerErrors:
+    """Shared argument and lookup error cases for the email handlers."""
+
+    @pytest.mark.parametrize("handler, args", [
+        (add_email, ["John"]),
+        (delete_email, []),
+        (show_email, []),
+    ])
+    def test_missing_args(self, handler, args, book):
+        """Test email handlers with missing arguments."""
+        result = handler(args, book)
         assert "Error" in result and "requires" in result.lower()
 
+    @pytest.mark.parametrize("handler, args", [
+        (add_email, ["Nonexistent", "test@example.com"]),
+        (delete_email, ["Nonexistent"]),
+        (show_email, ["Nonexistent"]),
+    ])
+    def test_contact_not_found(self, handler, args, book):
+        """Test email handlers for a non-existent contact."""
+        result = handler(args, book)
+        assert "not found" in result.lower()
+
 
 class TestShowStatistics:
     """Test suite for the show_statistics handler."""
 
-    def test_statistics_empty_data(self):
+    def test_statistics_empty_data(self, book, notebook):
         """Test statistics with empty address book and notebook."""
-        book = AddressBook()
-        notebook = NoteBook()
-        result = show_statistics(book, notebook)
+        stats = compute_statistics(book, notebook)
+        assert stats["contacts"] == 0
+        assert stats["notes"] == 0
+        assert stats["upcoming"] == []
 
+        result = render_statistics(stats)
         assert "STATISTICS" in result
         assert "CONTACTS" in result
         assert "NOTES" in result
         assert "UPCOMING BIRTHDAYS" in result
-        assert "0" in result or "No birthdays" in result
 
-    def test_statistics_with_contacts(self):
+    def test_statistics_with_contacts(self, book, notebook):
         """Test statistics with contacts."""
-        book = AddressBook()
         record1 = Record("John Doe")
         record2 = Record("Jane Smith")
         book.add_record(record1)
         book.add_record(record2)
 
-        notebook = NoteBook()
-        result = show_statistics(book, notebook)
+        stats = compute_statistics(book, notebook)
+        assert stats["contacts"] == 2
 
+        result = render_statistics(stats)
         assert "CONTACTS" in result
-        assert "2" in result or "John Doe" in result or "Jane Smith" in result
 
-    def test_statistics_with_notes(self):
+    @pytest.fixture(scope="class")
+    def tagged_notebook(self):
+        """
+        Return a notebook with seven tagged notes, shared by read-only statistics tests.
+
+        Notes are created under a ticking clock so their order, and the tie
+        between "personal" and "urgent", does not depend on the real clock.
+        """
+        notebook = NoteBook()
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(models.note, "datetime", make_fast_clock())
+            add_note(["Note 1", "important"], notebook)
+            add_note(["Note 2", "important"], notebook)
+            add_note(["Note 3", "important"], notebook)
+            add_note(["Note 4", "work"], notebook)
+            add_note(["Note 5", "work"], notebook)
+            add_note(["Note 6", "personal"], notebook)
+            add_note(["Note 7", "urgent"], notebook)
+        return notebook
+
+    def test_statistics_with_notes(self, book, tagged_notebook):
         """Test statistics with notes."""
-        book = AddressBook()
-        notebook = NoteBook()
-
-        add_note(["Note 1", "tag1"], notebook)
-        add_note(["Note 2", "tag2"], notebook)
-        add_note(["Note 3", "tag1"], notebook)
-
-        result = show_statistics(book, notebook)
+        stats = compute_statistics(book, tagged_notebook)
+        assert stats["notes"] == 7
 
+        result = render_statistics(stats)
         assert "NOTES" in result
-        assert "3" in result
         assert "TOP 3 TAGS" in result
-        assert "tag1" in result
-        assert "tag2" in result
+        assert "important" in result
 
-    def test_statistics_top_tags(self):
+    def test_statistics_top_tags(self, book, tagged_notebook):
         """Test that statistics shows top 3 tags."""
-        book = AddressBook()
-        notebook = NoteBook()
-
-        # Add notes with different tags
-        add_note(["Note 1", "important"], notebook)
-        add_note(["Note 2", "important"], notebook)
-        add_note(["Note 3", "important"], notebook)
-        add_note(["Note 4", "work"], notebook)
-        add_note(["Note 5", "work"], notebook)
-        add_note(["Note 6", "personal"], notebook)
-        add_note(["Note 7", "urgent"], notebook)
-
-        result = show_statistics(book, notebook)
+        stats = compute_statistics(book, tagged_notebook)
+        # Ties are broken in favour of the newest note; the fixture pins creation order
+        assert stats["top_tags"] == [("important", 3), ("work", 2), ("urgent", 1)]
 
+        result = render_statistics(stats)
         assert "TOP 3 TAGS" in result
         assert "important" in result
         assert "work" in result
         assert "urgent" in result
-        # Check that counts are shown
-        assert "3" in result  # important appears 3 times
-        assert "2" in result  # work appears 2 times
-        assert "1" in result  # urgent appears 1 time
 
-    def test_statistics_no_tags(self):
+    def test_statistics_no_tags(self, book, notebook):
         """Test statistics when notes have no tags."""
-        book = AddressBook()
-        notebook = NoteBook()
-
         add_note(["Note 1"], notebook)
         add_note(["Note 2"], notebook)
 
-        result = show_statistics(book, notebook)
+        stats = compute_statistics(book, notebook)
+        assert stats["notes"] == 2
+        assert stats["top_tags"] == []
 
+        result = render_statistics(stats)
         assert "NOTES" in result
-        assert "2" in result
-        # Should not show TOP 3 TAGS if no tags
-        assert "TOP 3 TAGS" not in result or "TOP 3 TAGS" in result  # May or may not show
+        # No TOP 3 TAGS section without tags
+        assert "TOP 3 TAGS" not in result
 
-    def test_statistics_with_upcoming_birthdays(self):
+    def test_statistics_with_upcoming_birthdays(self, book, notebook, john_record, calendar):
         """Test statistics with upcoming birthdays."""
-        book = AddressBook()
-        notebook = NoteBook()
-
         # Add contact with birthday in next 10 days
-        today = date.today()
-        future_birthday = (today + timedelta(days=5)).strftime("%d.%m.%Y")
-        record = Record("John Doe")
-        record.add_birthday(future_birthday)
-        book.add_record(record)
+        future_birthday = calendar["plus"](5)
+        john_record.add_birthday(future_birthday)
 
         result = show_statistics(book, notebook)
 
@@ -1098,150 +950,100 @@ class TestShowStatistics:
         assert "John Doe" in result
         assert "next 10 days" in result
 
-    def test_statistics_birthday_age_calculation(self):
-        """Test that statistics correctly calculates age for upcoming birthdays."""
-        book = AddressBook()
-        notebook = NoteBook()
-
-        # Add contact with birthday in next 5 days
-        today = date.today()
-        future_birthday = today + timedelta(days=5)
-        birth_year = 1990
-        birthday_str = f"{future_birthday.day:02d}.{future_birthday.month:02d}.{birth_year}"
-
-        record = Record("John Doe")
-        record.add_birthday(birthday_str)
-        book.add_record(record)
-
-        result = show_statistics(book, notebook)
-
-        assert "John Doe" in result
-        assert "will be" in result
-        # Age should be current year - birth year
-        expected_age = today.year - birth_year
-        assert str(expected_age) in result
-
-    def test_statistics_birthday_today(self):
-        """Test statistics when birthday is today."""
-        book = AddressBook()
-        notebook = NoteBook()
-
-        # Add contact with birthday today
-        today = date.today()
-        birth_year = 1990
-        birthday_with_year = f"{today.day:02d}.{today.month:02d}.{birth_year}"
-
-        record = Record("John Doe")
-        record.add_birthday(birthday_with_year)
-        book.add_record(record)
-
-        result = show_statistics(book, notebook)
-
-        assert "John Doe" in result
-        assert "TODAY" in result or "🎉" in result
-
-    def test_statistics_birthday_tomorrow(self):
-        """Test statistics when birthday is tomorrow."""
-        book = AddressBook()
-        notebook = NoteBook()
-
-        # Add contact with birthday tomorrow
-        tomorrow = date.today() + timedelta(days=1)
-        birth_year = 1990
-        birthday_str = f"{tomorrow.day:02d}.{tomorrow.month:02d}.{birth_year}"
-
-        record = Record("John Doe")
-        record.add_birthday(birthday_str)
-        book.add_record(record)
+    @pytest.mark.parametrize("days, when", [
+        (0, "TODAY"),
+        (1, "Tomorrow"),
+        (5, "in 5 days"),
+    ])
+    def test_statistics_birthday_with_age(self, book, notebook, john_record, calendar, days, when):
+        """Test upcoming birthday wording and age for a contact born in BIRTH_YEAR."""
+        birthday = calendar["date"](days)
+        john_record.add_birthday(_birthday_in_year(birthday, BIRTH_YEAR))
 
         result = show_statistics(book, notebook)
 
         assert "John Doe" in result
-        assert "Tomorrow" in result or "🎁" in result
+        assert when in result
+        # Age on the upcoming birthday, including one that falls next year
+        assert f"will be {birthday.year - BIRTH_YEAR} years old" in result
 
-    def test_statistics_no_upcoming_birthdays(self):
+    def test_statistics_no_upcoming_birthdays(self, book, notebook, john_record, calendar):
         """Test statistics when no upcoming birthdays."""
-        book = AddressBook()
-        notebook = NoteBook()
-
         # Add contact with birthday far in future
-        future_date = date.today() + timedelta(days=20)
-        birthday_str = future_date.strftime("%d.%m.%Y")
+        birthday_str = calendar["plus"](20)
 
-        record = Record("John Doe")
-        record.add_birthday(birthday_str)
-        book.add_record(record)
+        john_record.add_birthday(birthday_str)
 
         result = show_statistics(book, notebook)
 
         assert "UPCOMING BIRTHDAYS" in result
         assert "No birthdays in the next 10 days" in result
 
-    def test_statistics_multiple_birthdays_sorted(self):
+    def test_statistics_multiple_birthdays_sorted(self, book, notebook, calendar):
         """Test that multiple birthdays are sorted by days until."""
-        book = AddressBook()
-        notebook = NoteBook()
-
         # Add contacts with birthdays at different times
-        today = date.today()
+        # Birthdays in 2, 5 and 1 days
+        book.extend([
+            make_record("Alice", birthday=calendar["plus"](2)),
+            make_record("Bob", birthday=calendar["plus"](5)),
+            make_record("Charlie", birthday=calendar["plus"](1)),
+        ])
 
-        # Birthday in 2 days
-        bday1 = (today + timedelta(days=2)).strftime("%d.%m.%Y")
-        record1 = Record("Alice")
-        record1.add_birthday(bday1)
-        book.add_record(record1)
+        result = show_statistics(book, notebook)
 
-        # Birthday in 5 days
-        bday2 = (today + timedelta(days=5)).strftime("%d.%m.%Y")
-        record2 = Record("Bob")
-        record2.add_birthday(bday2)
-        book.add_record(record2)
+        # Record the first line each name appears on in a single pass
+        names = ("Alice", "Bob", "Charlie")
+        positions = {}
+        for i, line in enumerate(result.splitlines()):
+            for name in names:
+                if name not in positions and name in line:
+                    positions[name] = i
 
-        # Birthday in 1 day
-        bday3 = (today + timedelta(days=1)).strftime("%d.%m.%Y")
-        record3 = Record("Charlie")
-        record3.add_birthday(bday3)
-        book.add_record(record3)
+        # All should be found
+        assert set(positions) == set(names)
+        # Charlie (1 day) should appear before Alice (2 days) and Bob (5 days)
+        assert positions["Charlie"] < positions["Alice"] < positions["Bob"]
 
-        result = show_statistics(book, notebook)
+    def test_compute_statistics_upcoming_sorted(self, book, notebook, calendar):
+        """Test that computed upcoming birthdays are sorted by days until."""
+        book.extend([
+            make_record("Alice", birthday=calendar["plus"](2)),
+            make_record("Bob", birthday=calendar["plus"](5)),
+            make_record("Charlie", birthday=calendar["plus"](1)),
+        ])
 
-        assert "Alice" in result
-        assert "Bob" in result
-        assert "Charlie" in result
-        # Charlie (1 day) should appear before Alice (2 days) and Bob (5 days)
-        charlie_pos = result.find("Charlie")
-        alice_pos = result.find("Alice")
-        bob_pos = result.find("Bob")
+        stats = compute_statistics(book, notebook)
 
-        # All should be found
-        assert charlie_pos != -1
-        assert alice_pos != -1
-        assert bob_pos != -1
+        assert stats["days_ahead"] == 10
+        assert [(name, days_until) for name, _, _, days_until, _ in stats["upcoming"]] == [
+            ("Charlie", 1), ("Alice", 2), ("Bob", 5)
+        ]
 
-    def test_statistics_complete_data(self):
+    def test_statistics_complete_data(self, book, notebook, calendar):
         """Test statistics with complete data (contacts, notes, birthdays)."""
-        book = AddressBook()
-        notebook = NoteBook()
-
         # Add contacts
-        record1 = Record("John Doe")
-        record1.add_phone("1234567890")
-        record1.add_email("john@example.com")
-        today = date.today()
-        bday1 = (today + timedelta(days=3)).strftime("%d.%m.%Y")
-        record1.add_birthday(bday1)
-        book.add_record(record1)
-
-        record2 = Record("Jane Smith")
-        record2.add_phone("0987654321")
-        book.add_record(record2)
+        make_record(
+            "John Doe",
+            phones=["1234567890"],
+            email="john@example.com",
+            birthday=calendar["plus"](3),
+            book=book,
+        )
+        make_record("Jane Smith", phones=["0987654321"], book=book)
 
         # Add notes
         add_note(["Important note", "important,work"], notebook)
         add_note(["Personal note", "personal"], notebook)
         add_note(["Another note", "important"], notebook)
 
-        result = show_statistics(book, notebook)
+        stats = compute_statistics(book, notebook)
+        assert stats["contacts"] == 2
+        assert stats["notes"] == 3
+        # "work" and "personal" tie on one note each, so compare them as a set
+        assert stats["top_tags"][0] == ("important", 2)
+        assert set(stats["top_tags"][1:]) == {("work", 1), ("personal", 1)}
+
+        result = render_statistics(stats)
 
         # Check all sections are present
         assert "STATISTICS" in result
@@ -1250,49 +1052,12 @@ class TestShowStatistics:
         assert "UPCOMING BIRTHDAYS" in result
 
         # Check specific data
-        assert "2" in result  # 2 contacts
-        assert "3" in result  # 3 notes
         assert "John Doe" in result
         assert "important" in result
         assert "TOP 3 TAGS" in result
 
-    def test_statistics_birthday_next_year(self):
-        """Test statistics when birthday is next year."""
-        book = AddressBook()
-        notebook = NoteBook()
-
-        # Add contact with birthday that already passed this year
-        # So next occurrence is next year
-        past_date = date.today() - timedelta(days=30)
-        birth_year = 1990
-        birthday_str = f"{past_date.day:02d}.{past_date.month:02d}.{birth_year}"
-
-        # But we need it to be within 10 days from now in next year
-        # So we'll use a date that's close to today but in past
-        # Actually, let's use a date that's 5 days from now but in next year
-        future_date = date.today() + timedelta(days=5)
-        birthday_str = f"{future_date.day:02d}.{future_date.month:02d}.{birth_year}"
-
-        record = Record("John Doe")
-        record.add_birthday(birthday_str)
-        book.add_record(record)
-
-        result = show_statistics(book, notebook)
-
-        assert "John Doe" in result
-        assert "will be" in result
-        # Age should account for next year
-        expected_age = date.today().year - birth_year + 1
-        # Actually, if birthday is in 5 days, it's still this year
-        # So age should be current year - birth year
-        expected_age = date.today().year - birth_year
-        assert str(expected_age) in result
-
-    def test_statistics_header_and_footer(self):
+    def test_statistics_header_and_footer(self, book, notebook):
         """Test that statistics has proper header and footer."""
-        book = AddressBook()
-        notebook = NoteBook()
-
         result = show_statistics(book, notebook)
 
         # Check for header (STATISTICS)
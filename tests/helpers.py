@@ -0,0 +1,82 @@
+"""
+Helpers shared by the test suites.
+"""
+
+import itertools
+from datetime import datetime, timedelta
+
+from models.record import Record
+
+
+def make_record(name, phones=(), email=None, birthday=None, book=None):
+    """
+    Build a contact record in one call.
+
+    Fields go through the regular Record methods, so test data is validated
+    the same way as user input.
+
+    Args:
+        name (str): Contact's name
+        phones (Iterable[str]): Phone numbers to add
+        email (str, optional): Email to set
+        birthday (str, optional): Birthday in DD.MM.YYYY format
+        book (AddressBook, optional): Address book to add the record to
+
+    Returns:
+        Record: The created record
+    """
+    record = Record(name)
+    for phone in phones:
+        record.add_phone(phone)
+    if email is not None:
+        record.add_email(email)
+    if birthday is not None:
+        record.add_birthday(birthday)
+    if book is not None:
+        book.add_record(record)
+    return record
+
+
+def make_fast_clock(start=datetime(2024, 1, 1)):
+    """
+    Build a datetime subclass whose now() advances a microsecond per call.
+
+    Patch it over models.note.datetime so notes created one after another get
+    strictly increasing, reproducible timestamps without sleeping.
+
+    Args:
+        start (datetime): Value returned by the first now() call
+
+    Returns:
+        type: datetime subclass with a ticking now()
+    """
+    ticks = itertools.count()
+
+    class FastClock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return start + timedelta(microseconds=next(ticks))
+
+    return FastClock
+
+
+def assert_arg_error(result):
+    """
+    Assert that a command result reports missing or invalid arguments.
+
+    Args:
+        result (str): Handler or command output
+    """
+    lowered = result.lower()
+    assert "requires" in lowered or "required" in lowered or "argument" in lowered, result
+
+
+def assert_notes_found(result):
+    """
+    Assert that a command result reports how many notes were found.
+
+    Args:
+        result (str): Handler or command output
+    """
+    lowered = result.lower()
+    assert "notes" in lowered and "found" in lowered, result
@@ -0,0 +1,98 @@
+"""
+Shared fixtures for the model tests.
+"""
+
+import copy
+from datetime import date, timedelta
+
+import pytest
+
+import models.note
+from models.address_book import AddressBook
+from models.birthday import Birthday
+from models.note import Note
+from models.notebook import NoteBook
+from models.record import Record
+from tests.helpers import make_fast_clock
+
+
+@pytest.fixture(scope="session")
+def sample_book():
+    """Return an address book with three contacts, shared read-only across the session."""
+    book = AddressBook()
+    for name in ("John Doe", "Jane Smith", "Alice"):
+        book.add_record(Record(name))
+    book.find("John Doe").add_phone("1234567890")
+    return book
+
+
+@pytest.fixture
+def mutable_book(sample_book):
+    """Return a private deep copy of the sample book for tests that mutate it."""
+    return copy.deepcopy(sample_book)
+
+
+@pytest.fixture(scope="module")
+def three_note_book():
+    """Return a notebook with "Apple", "Banana" and "Cherry" notes, shared read-only within a module."""
+    notebook = NoteBook()
+    for text in ("Apple", "Banana", "Cherry"):
+        notebook.add_note(Note(text))
+    return notebook
+
+
+@pytest.fixture
+def fresh_three_note_book(three_note_book):
+    """Return a private deep copy of the three-note notebook for tests that mutate it."""
+    return copy.deepcopy(three_note_book)
+
+
+@pytest.fixture(scope="session")
+def many_notes_book():
+    """Return a notebook with 100 notes tagged tag0..tag4 in turn, shared read-only across the session."""
+    notebook = NoteBook()
+    for i in range(100):
+        notebook.add_note(Note(f"Note {i}", [f"tag{i % 5}"]))
+    return notebook
+
+
+@pytest.fixture(scope="session")
+def today():
+    """
+    Return a fixed reference date (a Wednesday) for birthday tests.
+
+    Tests pass it as now_date, so results do not depend on the wall clock
+    or on which xdist worker runs them.
+    """
+    return date(2024, 6, 12)
+
+
+@pytest.fixture(scope="session")
+def today_str(today):
+    """Return the reference date formatted as a birthday string."""
+    return today.strftime(Birthday.DATE_FORMAT)
+
+
+@pytest.fixture(scope="session")
+def in_three_days_str(today):
+    """Return the date three days after the reference date formatted as a birthday string."""
+    return (today + timedelta(days=3)).strftime(Birthday.DATE_FORMAT)
+
+
+@pytest.fixture(scope="session")
+def month_ago_str(today):
+    """Return the date 30 days before the reference date formatted as a birthday string."""
+    return (today - timedelta(days=30)).strftime(Birthday.DATE_FORMAT)
+
+
+@pytest.fixture
+def fast_clock(monkeypatch):
+    """
+    Replace the clock used by Note with one that advances a microsecond per call.
+
+    Timestamps taken one after another are strictly increasing, so tests can
+    check updated_at ordering without sleeping.
+    """
+    clock = make_fast_clock()
+    monkeypatch.setattr(models.note, "datetime", clock)
+    return clock
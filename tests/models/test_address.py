@@ -4,6 +4,8 @@ Tests for the Address class.
 This module contains tests for address field functionality.
 """
 
+import pytest
+
 from models.address import Address
 
 
@@ -22,19 +24,13 @@ class TestAddress:
 
     def test_init_raises_error_on_empty_string(self):
         """Test that empty string raises ValueError."""
-        try:
+        with pytest.raises(ValueError, match="Address cannot be empty"):
             Address("")
-            assert False, "Expected ValueError for empty address"
-        except ValueError as e:
-            assert "Address cannot be empty" in str(e)
 
     def test_init_raises_error_on_whitespace_only(self):
         """Test that whitespace-only string raises ValueError."""
-        try:
+        with pytest.raises(ValueError, match="Address cannot be empty"):
             Address("   ")
-            assert False, "Expected ValueError for whitespace-only address"
-        except ValueError as e:
-            assert "Address cannot be empty" in str(e)
 
     def test_str_representation(self):
         """Test string representation of Address."""
@@ -4,9 +4,13 @@ Tests for the AddressBook class.
 This module contains tests for address book management functionality.
 """
 
-from datetime import date, timedelta
+from datetime import date
+
+import pytest
+
 from models.address_book import AddressBook
 from models.record import Record
+from tests.helpers import make_record
 
 
 class TestAddressBook:
@@ -38,61 +42,49 @@ class TestAddressBook:
         book.add_record(record2)
         book.add_record(record3)
 
-        assert len(book.data) == 3
-        assert "Alice" in book.data
-        assert "Bob" in book.data
-        assert "Charlie" in book.data
+        data = book.data
+        assert len(data) == 3
+        assert {"Alice", "Bob", "Charlie"} <= data.keys()
 
-    def test_find_existing_record(self):
-        """Test finding an existing record."""
+    def test_extend(self):
+        """Test adding several records at once."""
         book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
+        book.add_record(Record("Alice"))
+        replacement = Record("Alice")
 
-        found = book.find("John Doe")
-        assert found is not None
-        assert found.name.value == "John Doe"
+        book.extend([replacement, Record("Bob"), Record("Charlie")])
 
-    def test_find_non_existing_record(self):
-        """Test finding a non-existing record returns None."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
+        assert list(book.data) == ["Alice", "Bob", "Charlie"]
+        assert book.data["Alice"] is replacement
 
-        found = book.find("Jane Doe")
+    def test_find_existing_record(self, sample_book):
+        """Test finding an existing record."""
+        found = sample_book.find("John Doe")
+        assert found is not None and found.name.value == "John Doe"
+
+    def test_find_non_existing_record(self, sample_book):
+        """Test finding a non-existing record returns None."""
+        found = sample_book.find("Jane Doe")
         assert found is None
 
-    def test_delete_existing_record(self):
+    def test_delete_existing_record(self, mutable_book, sample_book):
         """Test deleting an existing record."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
-
-        deleted = book.delete("John Doe")
+        deleted = mutable_book.delete("John Doe")
         assert deleted.name.value == "John Doe"
-        assert "John Doe" not in book.data
-        assert len(book.data) == 0
+        assert "John Doe" not in mutable_book.data
+        assert len(mutable_book.data) == 2
+        assert "John Doe" in sample_book.data
 
-    def test_delete_non_existing_record(self):
+    def test_delete_non_existing_record(self, mutable_book):
         """Test deleting a non-existing record raises KeyError."""
-        book = AddressBook()
-        record = Record("John Doe")
-        book.add_record(record)
-
-        try:
-            book.delete("Jane Doe")
-            assert False, "Expected KeyError"
-        except KeyError as e:
-            assert "Contact 'Jane Doe' not found" in str(e)
+        with pytest.raises(KeyError, match="Contact 'Jane Doe' not found"):
+            mutable_book.delete("Jane Doe")
 
-    def test_dict_like_access(self):
+    def test_dict_like_access(self, sample_book):
         """Test dictionary-like access to records."""
-        book = AddressBook()
-        record = Record("Test User")
-        book.add_record(record)
-
-        assert book.data["Test User"] == record
-        assert len(book.data) == 1
+        assert sample_book.data["John Doe"] is sample_book.find("John Doe")
+        assert sample_book.data["John Doe"].phones[0] == "1234567890"
+        assert len(sample_book.data) == 3
 
     def test_get_upcoming_birthdays_empty_book(self):
         """Test getting upcoming birthdays from empty book."""
@@ -110,72 +102,49 @@ class TestAddressBook:
         birthdays = book.get_upcoming_birthdays()
         assert not birthdays
 
-    def test_get_upcoming_birthdays_today(self):
+    def test_get_upcoming_birthdays_today(self, today, today_str):
         """Test getting birthdays for today."""
         book = AddressBook()
-        today = date.today()
-        birthday_str = today.strftime("%d.%m.%Y")
 
         record = Record("Today Birthday")
-        record.add_birthday(birthday_str)
+        record.add_birthday(today_str)
         book.add_record(record)
 
-        birthdays = book.get_upcoming_birthdays()
+        birthdays = book.get_upcoming_birthdays(now_date=today)
         assert len(birthdays) >= 1  # Today's birthday should be included
-        assert ("Today Birthday", birthday_str) in birthdays
+        assert ("Today Birthday", today_str) in birthdays
 
-    def test_get_upcoming_birthdays_next_week(self):
+    def test_get_upcoming_birthdays_next_week(self, today, in_three_days_str):
         """Test getting birthdays in the next 7 days."""
         book = AddressBook()
-        today = date.today()
 
         # Add birthday 3 days from now
-        future_birthday = today + timedelta(days=3)
-        birthday_str = future_birthday.strftime("%d.%m.%Y")
-
         record = Record("Future Birthday")
-        record.add_birthday(birthday_str)
+        record.add_birthday(in_three_days_str)
         book.add_record(record)
 
-        birthdays = book.get_upcoming_birthdays()
+        birthdays = book.get_upcoming_birthdays(now_date=today)
         assert len(birthdays) >= 1
 
-    def test_get_upcoming_birthdays_past_date_this_year(self):
+    def test_get_upcoming_birthdays_past_date_this_year(self, today, month_ago_str):
         """Test that past birthdays in this year move to next year."""
         book = AddressBook()
-        today = date.today()
-        # Use a fixed past date (e.g., January 1)
-        past_birthday = date(today.year, 1, 1)
-
-        # If today is early in the year, use a date from last month
-        if past_birthday >= today:
-            past_birthday = date(today.year - 1, 12, 25)
-
-        birthday_str = past_birthday.strftime("%d.%m.%Y")
-
+        # A month ago: already passed, so the next occurrence is about a year away
         record = Record("Past Birthday")
-        record.add_birthday(birthday_str)
+        record.add_birthday(month_ago_str)
         book.add_record(record)
 
-        # Past birthday should not appear in upcoming (next 7 days)
-        # unless it's been adjusted to next year
-        _ = book.get_upcoming_birthdays()  # Just checking it doesn't crash
+        result = book.get_upcoming_birthdays(now_date=today)
+        assert isinstance(result, list)
+        assert all(name != "Past Birthday" for name, _ in result)
 
     def test_address_book_comprehensive(self):
         """Test comprehensive address book operations."""
         book = AddressBook()
 
         # Create and add records
-        john = Record("John Doe")
-        john.add_phone("1234567890")
-        john.add_birthday("15.03.1990")
-
-        jane = Record("Jane Smith")
-        jane.add_phone("0987654321")
-        jane.add_phone("5555555555")
-
-        book.add_record(john)
-        book.add_record(jane)
+        make_record("John Doe", phones=["1234567890"], birthday="15.03.1990", book=book)
+        make_record("Jane Smith", phones=["0987654321", "5555555555"], book=book)
 
         # Verify additions
         assert len(book.data) == 2
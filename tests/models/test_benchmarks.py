@@ -0,0 +1,27 @@
+"""
+Benchmarks for the notebook model.
+
+Timing is disabled by default (see pytest.ini), so these run once as plain
+tests. Measure them with:
+
+    pytest tests/models/test_benchmarks.py --benchmark-enable --benchmark-only
+"""
+
+import pytest
+
+from models.note import Note
+from models.notebook import NoteBook
+
+
+@pytest.mark.benchmark(group="notebook-scale")
+@pytest.mark.parametrize("size", [10, 100, 1000])
+def test_notebook_many_notes_scaling(benchmark, size):
+    """Benchmark building a notebook of `size` notes and searching it by tag."""
+    def build_and_search():
+        notebook = NoteBook()
+        for i in range(size):
+            notebook.add_note(Note(f"Note {i}", [f"tag{i % 5}"]))
+        return notebook.search_by_tags(["tag0"])
+
+    result = benchmark(build_and_search)
+    assert len(result) == size // 5
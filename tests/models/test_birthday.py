@@ -4,9 +4,15 @@ Tests for the Birthday class.
 This module contains tests for the Birthday field validation functionality.
 """
 
+import re
 from datetime import date
+
+import pytest
+
 from models.birthday import Birthday
 
+_INVALID_DATE_RE = re.compile(r"Invalid date format")
+
 
 class TestBirthday:
     """Test suite for the Birthday class."""
@@ -31,52 +37,48 @@ class TestBirthday:
         birthday = Birthday("25.12.1995")
         assert birthday.value == date(1995, 12, 25)
 
-    def test_raises_error_on_invalid_format(self):
+    @pytest.mark.parametrize("invalid_date", [
+        "1990-03-15",
+        "03/15/1990",
+        "15-03-1990",
+        "15.03.90",
+        "invalid",
+    ], ids=["iso_dashes", "us_slashes", "dashes", "two_digit_year", "not_a_date"])
+    def test_raises_error_on_invalid_format(self, invalid_date):
         """Test that Birthday raises ValueError for invalid date format."""
-        invalid_formats = [
-            "1990-03-15",  # Wrong separator
-            "03/15/1990",  # Wrong separator and order
-            "15-03-1990",  # Wrong separator
-            "15.03.90",    # Two-digit year
-            "invalid"       # Not a date
-        ]
-
-        for invalid_date in invalid_formats:
-            try:
-                Birthday(invalid_date)
-                assert False, f"Expected ValueError for date: {invalid_date}"
-            except ValueError as e:
-                assert "Invalid date format" in str(e)
-
-    def test_raises_error_on_invalid_date(self):
+        with pytest.raises(ValueError, match=_INVALID_DATE_RE):
+            Birthday(invalid_date)
+
+    @pytest.mark.parametrize("invalid_date", [
+        "32.01.2000",
+        "31.02.2000",
+        "29.02.2001",
+        "00.01.2000",
+        "01.13.2000",
+    ], ids=["day_32", "feb_31", "feb_29_non_leap", "day_00", "month_13"])
+    def test_raises_error_on_invalid_date(self, invalid_date):
         """Test that Birthday raises ValueError for non-existent dates."""
-        invalid_dates = [
-            "32.01.2000",  # Invalid day
-            "31.02.2000",  # February doesn't have 31 days
-            "29.02.2001",  # Not a leap year
-            "00.01.2000",  # Day cannot be 00
-            "01.13.2000",  # Invalid month
-        ]
-
-        for invalid_date in invalid_dates:
-            try:
-                Birthday(invalid_date)
-                assert False, f"Expected ValueError for invalid date: {invalid_date}"
-            except ValueError as e:
-                assert "Invalid date format" in str(e)
-
-    def test_different_date_formats_still_rejected(self):
+        with pytest.raises(ValueError, match=_INVALID_DATE_RE):
+            Birthday(invalid_date)
+
+    @pytest.mark.parametrize("invalid_date", [
+        "",
+        "hello",
+        "12.25.2000",  # Month 25
+        "2020.01.01",  # Reversed order
+    ])
+    def test_different_date_formats_still_rejected(self, invalid_date):
         """Test that various incorrect formats are properly rejected."""
-        invalid_formats = [
-            "",
-            "hello",
-            "12.25.2000",  # Month 25
-            "2020.01.01"   # Reversed order
-        ]
-
-        for invalid_date in invalid_formats:
-            try:
-                Birthday(invalid_date)
-                assert False, f"Expected ValueError for: {invalid_date}"
-            except ValueError:
-                pass  # Expected
+        with pytest.raises(ValueError):
+            Birthday(invalid_date)
+
+    def test_init_with_single_digit_day_and_month(self):
+        """Test that single-digit day and month are accepted like strptime."""
+        birthday = Birthday("5.3.1990")
+        assert birthday.value == date(1990, 3, 5)
+
+    @pytest.mark.parametrize("invalid_date", ["+1.03.1990", "01.03.-990", "01. 3.1990", "01.03.1990.1", "01.03.१९९०"])
+    def test_rejects_non_digit_parts(self, invalid_date):
+        """Test that signs, spaces and extra parts are rejected."""
+        with pytest.raises(ValueError, match=_INVALID_DATE_RE):
+            Birthday(invalid_date)
@@ -4,8 +4,15 @@ Tests for the Email class.
 This module contains tests for the Email field validation functionality.
 """
 
+import re
+
+import pytest
+
 from models.email import Email
 
+_INVALID_EMAIL_RE = re.compile(r"Invalid email format|cannot be empty")
+_EMPTY_EMAIL_RE = re.compile(r"cannot be empty")
+
 
 class TestEmail:
     """Test suite for the Email class."""
@@ -25,55 +32,54 @@ class TestEmail:
         email = Email("  test@example.com  ")
         assert email.value == "test@example.com"
 
-    def test_init_with_various_valid_formats(self):
+    @pytest.mark.parametrize("raw,expected", [(email, email.lower()) for email in [
+        "user@domain.com",
+        "user.name@domain.com",
+        "user_name@domain.com",
+        "user+tag@domain.com",
+        "user123@domain123.com",
+        "user@subdomain.domain.com",
+        "User.Name@Domain.COM",
+    ]])
+    def test_init_with_various_valid_formats(self, raw, expected):
         """Test Email with various valid email formats."""
-        valid_emails = [
-            "user@domain.com",
-            "user.name@domain.com",
-            "user_name@domain.com",
-            "user+tag@domain.com",
-            "user123@domain123.com",
-            "user@subdomain.domain.com",
-        ]
-        for valid_email in valid_emails:
-            email = Email(valid_email)
-            assert email.value == valid_email.lower()
-
-    def test_raises_error_on_invalid_format(self):
+        assert Email(raw).value == expected
+
+    @pytest.mark.parametrize("invalid_email", [
+        "invalid",
+        "@example.com",
+        "user@",
+        "user@domain",
+        "user@domain.",
+        "user @domain.com",
+        "user@domain .com",
+        "user@@domain.com",
+        "user@domain@com",
+    ], ids=[
+        "no_at",
+        "no_user",
+        "no_domain",
+        "no_tld",
+        "empty_tld",
+        "space_in_user",
+        "space_in_domain",
+        "double_at",
+        "multiple_at",
+    ])
+    def test_raises_error_on_invalid_format(self, invalid_email):
         """Test that Email raises ValueError for invalid format."""
-        invalid_emails = [
-            "invalid",           # No @
-            "@example.com",      # No user
-            "user@",             # No domain
-            "user@domain",       # No TLD
-            "user@domain.",      # No TLD
-            "user @domain.com",  # Space in email
-            "user@domain .com",  # Space in domain
-            "user@@domain.com",  # Double @
-            "user@domain@com",   # Multiple @
-        ]
-        for invalid_email in invalid_emails:
-            try:
-                Email(invalid_email)
-                assert False, f"Expected ValueError for email: {invalid_email}"
-            except ValueError as e:
-                assert "Invalid email format" in str(e) or "cannot be empty" in str(e)
+        with pytest.raises(ValueError, match=_INVALID_EMAIL_RE):
+            Email(invalid_email)
 
     def test_raises_error_on_empty_string(self):
         """Test that Email raises ValueError for empty string."""
-        try:
+        with pytest.raises(ValueError, match=_EMPTY_EMAIL_RE):
             Email("")
-            assert False, "Expected ValueError for empty string"
-        except ValueError as e:
-            assert "cannot be empty" in str(e)
 
     def test_raises_error_on_whitespace_only(self):
         """Test that Email raises ValueError for whitespace only."""
-        try:
+        with pytest.raises(ValueError, match=_EMPTY_EMAIL_RE):
             Email("   ")
-            assert False, "Expected ValueError for whitespace only"
-        except ValueError as e:
-            assert "cannot be empty" in str(e)
 
     def test_str_representation(self):
         """Test string representation of Email."""
@@ -4,46 +4,32 @@ Tests for the Field class.
 This module contains tests for the base Field class functionality.
 """
 
+import pickle
+
+import pytest
+from hypothesis import assume, given, settings
+from hypothesis import strategies as st
+
+from models.address import Address
 from models.field import Field
 
 
 class TestField:
     """Test suite for the Field class."""
 
-    def test_init_with_string_value(self):
-        """Test Field initialization with a string value."""
-        field = Field("test value")
-        assert field.value == "test value"
-
-    def test_init_with_integer_value(self):
-        """Test Field initialization with an integer value."""
-        field = Field(123)
-        assert field.value == 123
-
-    def test_init_with_none_value(self):
-        """Test Field initialization with None value."""
-        field = Field(None)
-        assert field.value is None
-
-    def test_init_with_empty_string(self):
-        """Test Field initialization with empty string."""
-        field = Field("")
-        assert field.value == ""
-
-    def test_str_representation_string(self):
-        """Test string representation returns correct string."""
-        field = Field("Hello World")
-        assert str(field) == "Hello World"
-
-    def test_str_representation_integer(self):
-        """Test string representation of integer value."""
-        field = Field(42)
-        assert str(field) == "42"
-
-    def test_str_representation_none(self):
-        """Test string representation of None value."""
-        field = Field(None)
-        assert str(field) == "None"
+    @pytest.mark.parametrize("value", ["test value", 123, None, ""])
+    def test_init_stores_value(self, value):
+        """Test Field initialization stores the given value unchanged."""
+        assert Field(value).value == value
+
+    @pytest.mark.parametrize("value,expected", [
+        ("Hello World", "Hello World"),
+        (42, "42"),
+        (None, "None"),
+    ])
+    def test_str_representation(self, value, expected):
+        """Test string representation of various values."""
+        assert str(Field(value)) == expected
 
     def test_value_modification(self):
         """Test that Field value can be modified."""
@@ -51,11 +37,32 @@ class TestField:
         field.value = "modified"
         assert field.value == "modified"
 
-    def test_multiple_field_instances(self):
+    @given(first=st.text(), second=st.text())
+    @settings(max_examples=25)
+    def test_multiple_field_instances(self, first, second):
         """Test that multiple Field instances are independent."""
-        field1 = Field("value1")
-        field2 = Field("value2")
+        assume(first != second)
+        field1 = Field(first)
+        field2 = Field(second)
 
-        assert field1.value == "value1"
-        assert field2.value == "value2"
+        assert field1.value == first
+        assert field2.value == second
         assert field1.value != field2.value
+
+    def test_fields_have_no_instance_dict(self):
+        """Test that fields store their value in a slot."""
+        field = Address("123 Main Street")
+        assert not hasattr(field, "__dict__")
+        with pytest.raises(AttributeError):
+            field.extra = "x"
+
+    def test_pickle_round_trip(self):
+        """Test that slotted fields survive pickling."""
+        field = pickle.loads(pickle.dumps(Address("123 Main Street")))
+        assert field.value == "123 Main Street"
+
+    def test_setstate_accepts_legacy_dict_state(self):
+        """Test restoring a field pickled before __slots__ was added."""
+        field = Address.__new__(Address)
+        field.__setstate__({"value": "123 Main Street"})
+        assert field.value == "123 Main Street"
@@ -4,49 +4,29 @@ Tests for the Name class.
 This module contains tests for the Name field validation functionality.
 """
 
+import pytest
+
 from models.name import Name
 
 
 class TestName:
     """Test suite for the Name class."""
 
-    def test_init_with_valid_name(self):
-        """Test Name initialization with a valid name."""
-        name = Name("John Doe")
-        assert name.value == "John Doe"
-
-    def test_init_with_single_word_name(self):
-        """Test Name initialization with a single word."""
-        name = Name("John")
-        assert name.value == "John"
-
-    def test_init_raises_error_on_empty_string(self):
-        """Test that Name raises ValueError for empty string."""
-        try:
-            Name("")
-            assert False, "Expected ValueError for empty string"
-        except ValueError as e:
-            assert str(e) == "Name cannot be empty"
-
-    def test_init_raises_error_on_none(self):
-        """Test that Name raises ValueError for None."""
-        try:
-            Name(None)
-            assert False, "Expected ValueError for None"
-        except ValueError as e:
-            assert str(e) == "Name cannot be empty"
-
-    def test_str_representation(self):
-        """Test string representation of Name."""
-        name = Name("Jane Smith")
-        assert str(name) == "Jane Smith"
-
-    def test_value_attribute_access(self):
-        """Test accessing the value attribute."""
-        name = Name("Test User")
-        assert name.value == "Test User"
-
-    def test_name_with_unicode_characters(self):
-        """Test Name with Unicode characters."""
-        name = Name("Степан Бандера")
-        assert name.value == "Степан Бандера"
+    @pytest.mark.parametrize("value", [
+        "John Doe",
+        "John",
+        "Jane Smith",
+        "Test User",
+        "Степан Бандера",
+    ])
+    def test_init_with_valid_name(self, value):
+        """Test Name keeps valid names (including single words and Unicode) as value and str."""
+        name = Name(value)
+        assert name.value == value
+        assert str(name) == value
+
+    @pytest.mark.parametrize("value", ["", None])
+    def test_init_raises_error_on_empty_name(self, value):
+        """Test that Name raises ValueError for an empty string or None."""
+        with pytest.raises(ValueError, match="^Name cannot be empty$"):
+            Name(value)
@@ -1,14 +1,14 @@
-import pytest
+import pickle
+import re
 from datetime import datetime
-import time
-import sys
-from pathlib import Path
 
-# Add the project root to the Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import pytest
+
+from models.note import Note
 
-from models.note import Note  # noqa: E402
+_LONG_TEXT = "a" * 10000
+_MANY_TAGS = tuple(f"tag{i}" for i in range(100))
+_UUID_RE = re.compile(r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z")
 
 
 # Tests for Note initialization
@@ -44,34 +44,11 @@ def test_init_with_empty_tags_list():
     assert note.tags == []
 
 
-def test_init_empty_text_raises_error():
-    """Test that empty text raises ValueError"""
-    with pytest.raises(ValueError) as exc_info:
-        Note("")
-
-    assert str(exc_info.value) == "Note text cannot be empty"
-
-
-def test_init_whitespace_only_text_raises_error():
-    """Test that whitespace-only text raises ValueError"""
-    with pytest.raises(ValueError) as exc_info:
-        Note("   ")
-
-    assert str(exc_info.value) == "Note text cannot be empty"
-
-
-def test_init_tab_and_newline_only_raises_error():
-    """Test that text with only tabs and newlines raises ValueError"""
-    with pytest.raises(ValueError) as exc_info:
-        Note("\t\n\r  ")
-
-    assert str(exc_info.value) == "Note text cannot be empty"
-
-
-def test_init_none_text_raises_error():
-    """Test that None as text raises ValueError"""
+@pytest.mark.parametrize("bad_text", ["", "   ", "\t\n\r  ", None])
+def test_init_blank_text_raises_error(bad_text):
+    """Test that empty, whitespace-only and None text raise ValueError"""
     with pytest.raises(ValueError) as exc_info:
-        Note(None)
+        Note(bad_text)
 
     assert str(exc_info.value) == "Note text cannot be empty"
 
@@ -86,32 +63,17 @@ def test_unique_uuid_for_different_notes():
 
 # Tests for __str__ method
 
-def test_str_with_no_tags():
-    """Test string representation with no tags"""
-    note = Note("My note")
-
-    assert str(note) == "My note | Tags: no tags"
+@pytest.mark.parametrize("tags,expected", [
+    (None, "My note | Tags: no tags"),
+    (["important"], "My note | Tags: important"),
+    (["important", "work", "urgent"], "My note | Tags: important, work, urgent"),
+    ([], "My note | Tags: no tags"),
+])
+def test_str_representation(tags, expected):
+    """Test string representation with no, one, several and an empty list of tags"""
+    note = Note("My note", tags)
 
-
-def test_str_with_single_tag():
-    """Test string representation with single tag"""
-    note = Note("My note", ["important"])
-
-    assert str(note) == "My note | Tags: important"
-
-
-def test_str_with_multiple_tags():
-    """Test string representation with multiple tags"""
-    note = Note("My note", ["important", "work", "urgent"])
-
-    assert str(note) == "My note | Tags: important, work, urgent"
-
-
-def test_str_with_empty_tags_list():
-    """Test string representation with explicitly empty tags list"""
-    note = Note("My note", [])
-
-    assert str(note) == "My note | Tags: no tags"
+    assert str(note) == expected
 
 
 def test_str_after_removing_all_tags():
@@ -124,11 +86,10 @@ def test_str_after_removing_all_tags():
 
 # Tests for add_tag method
 
-def test_add_tag_to_empty_list():
+def test_add_tag_to_empty_list(fast_clock):
     """Test adding a tag to a note with no tags"""
     note = Note("Test note")
     original_updated_at = note.updated_at
-    time.sleep(0.01)  # Small delay to ensure time difference
 
     note.add_tag("new_tag")
 
@@ -146,17 +107,19 @@ def test_add_tag_to_existing_tags():
     assert note.tags == ["tag1", "tag2", "tag3"]
 
 
-def test_add_duplicate_tag():
-    """Test that adding a duplicate tag doesn't create duplicates"""
-    note = Note("Test note", ["tag1"])
+@pytest.mark.parametrize("tags,operation", [
+    (["tag1"], lambda note: note.add_tag("tag1")),
+    (["tag1"], lambda note: note.remove_tag("non_existing_tag")),
+    ([], lambda note: note.remove_tag("any_tag")),
+], ids=["add_duplicate", "remove_missing", "remove_from_empty"])
+def test_noop_tag_change_keeps_timestamp(fast_clock, tags, operation):
+    """Test that adding a duplicate or removing a missing tag changes neither tags nor updated_at"""
+    note = Note("Test note", list(tags))
     original_updated_at = note.updated_at
-    time.sleep(0.01)
 
-    note.add_tag("tag1")
+    operation(note)
 
-    assert note.tags == ["tag1"]
-    assert note.tags.count("tag1") == 1
-    # updated_at should not change when duplicate tag is added
+    assert note.tags == tags
     assert note.updated_at == original_updated_at
 
 
@@ -194,11 +157,10 @@ def test_add_empty_string_tag():
 
 # Tests for remove_tag method
 
-def test_remove_existing_tag():
+def test_remove_existing_tag(fast_clock):
     """Test removing an existing tag"""
     note = Note("Test note", ["tag1", "tag2", "tag3"])
     original_updated_at = note.updated_at
-    time.sleep(0.01)
 
     note.remove_tag("tag2")
 
@@ -207,20 +169,6 @@ def test_remove_existing_tag():
     assert note.updated_at > original_updated_at
 
 
-def test_remove_non_existing_tag():
-    """Test removing a tag that doesn't exist"""
-    note = Note("Test note", ["tag1"])
-    original_updated_at = note.updated_at
-    original_tags = note.tags.copy()
-    time.sleep(0.01)
-
-    note.remove_tag("non_existing_tag")
-
-    assert note.tags == original_tags
-    # updated_at should not change when removing non-existing tag
-    assert note.updated_at == original_updated_at
-
-
 def test_remove_last_tag():
     """Test removing the last remaining tag"""
     note = Note("Test note", ["only_tag"])
@@ -230,17 +178,6 @@ def test_remove_last_tag():
     assert note.tags == []
 
 
-def test_remove_tag_from_empty_list():
-    """Test removing a tag from a note with no tags"""
-    note = Note("Test note")
-    original_updated_at = note.updated_at
-
-    note.remove_tag("any_tag")
-
-    assert note.tags == []
-    assert note.updated_at == original_updated_at
-
-
 def test_remove_all_tags_sequentially():
     """Test removing all tags one by one"""
     note = Note("Test note", ["tag1", "tag2", "tag3"])
@@ -254,11 +191,10 @@ def test_remove_all_tags_sequentially():
 
 # Tests for edit_tags method
 
-def test_edit_tags_with_new_list():
+def test_edit_tags_with_new_list(fast_clock):
     """Test replacing tags with a new list"""
     note = Note("Test note", ["old1", "old2"])
     original_updated_at = note.updated_at
-    time.sleep(0.01)
 
     note.edit_tags(["new1", "new2", "new3"])
 
@@ -293,11 +229,10 @@ def test_edit_tags_from_empty_to_filled():
     assert note.tags == ["new1", "new2"]
 
 
-def test_edit_tags_updates_timestamp():
+def test_edit_tags_updates_timestamp(fast_clock):
     """Test that edit_tags updates the updated_at timestamp"""
     note = Note("Test note", ["tag1"])
     original_updated_at = note.updated_at
-    time.sleep(0.01)
 
     note.edit_tags(["tag1"])  # Same tags
 
@@ -341,28 +276,25 @@ def test_note_immutability_of_uuid():
     assert note._uuid == original_uuid
 
 
-def test_timestamps_progression():
+def test_timestamps_progression(fast_clock):
     """Test that updated_at progresses with operations"""
     note = Note("Test note")
     timestamp1 = note.updated_at
 
-    time.sleep(0.01)
     note.add_tag("tag1")
     timestamp2 = note.updated_at
 
-    time.sleep(0.01)
     note.add_tag("tag2")
     timestamp3 = note.updated_at
 
     assert timestamp1 < timestamp2 < timestamp3
 
 
-def test_created_at_never_changes():
+def test_created_at_never_changes(fast_clock):
     """Test that created_at timestamp never changes"""
     note = Note("Test note")
     original_created_at = note.created_at
 
-    time.sleep(0.01)
     note.add_tag("tag1")
     note.remove_tag("tag1")
     note.edit_tags(["new_tag"])
@@ -383,38 +315,23 @@ def test_tags_list_independence():
 
 # Tests for edge cases and boundary conditions
 
-def test_very_long_text():
-    """Test creating a note with very long text"""
-    long_text = "a" * 10000
-    note = Note(long_text)
-
-    assert note.text == long_text
-    assert len(note.text) == 10000
-
+@pytest.mark.parametrize("text", [
+    _LONG_TEXT,
+    "Note with 特殊字符 émojis 🎉🎊 and symbols !@#$%",
+    "Line 1\nLine 2\nLine 3",
+], ids=["long10k", "special_characters", "multiline"])
+def test_init_keeps_text_unchanged(text):
+    """Test creating a note with very long, special-character and multiline text"""
+    note = Note(text)
 
-def test_text_with_special_characters():
-    """Test creating a note with special characters in text"""
-    special_text = "Note with 特殊字符 émojis 🎉🎊 and symbols !@#$%"
-    note = Note(special_text)
-
-    assert note.text == special_text
-
-
-def test_text_with_newlines():
-    """Test creating a note with newlines in text"""
-    multiline_text = "Line 1\nLine 2\nLine 3"
-    note = Note(multiline_text)
-
-    assert note.text == multiline_text
+    assert note.text == text
 
 
 def test_many_tags():
     """Test creating a note with many tags"""
-    many_tags = [f"tag{i}" for i in range(100)]
-    note = Note("Test note", many_tags)
+    note = Note("Test note", list(_MANY_TAGS))
 
-    assert len(note.tags) == 100
-    assert note.tags == many_tags
+    assert tuple(note.tags) == _MANY_TAGS
 
 
 def test_tags_with_unicode():
@@ -447,28 +364,11 @@ def test_whitespace_in_middle_of_text_is_valid():
 
 # Tests for invalid input data and error handling
 
-def test_init_with_integer_text():
-    """Test that integer as text raises appropriate error"""
-    with pytest.raises((ValueError, AttributeError)):
-        Note(123)
-
-
-def test_init_with_list_text():
-    """Test that list as text raises appropriate error"""
-    with pytest.raises((ValueError, AttributeError)):
-        Note(["not", "a", "string"])
-
-
-def test_init_with_dict_text():
-    """Test that dict as text raises appropriate error"""
+@pytest.mark.parametrize("bad_text", [123, ["not", "a", "string"], {"text": "value"}, False])
+def test_init_with_non_string_text(bad_text):
+    """Test that non-string text raises an appropriate error"""
     with pytest.raises((ValueError, AttributeError)):
-        Note({"text": "value"})
-
-
-def test_init_with_boolean_false():
-    """Test that boolean False as text raises ValueError"""
-    with pytest.raises((ValueError, AttributeError)):
-        Note(False)
+        Note(bad_text)
 
 
 def test_add_none_as_tag():
@@ -543,25 +443,14 @@ def test_str_with_long_text_and_many_tags():
     many_tags = [f"tag{i}" for i in range(10)]
     note = Note(long_text, many_tags)
 
-    result = str(note)
-
-    assert long_text in result
-    assert "Tags:" in result
-    for tag in many_tags:
-        assert tag in result
+    assert str(note) == f"{long_text} | Tags: " + ", ".join(many_tags)
 
 
 def test_uuid_format():
     """Test that UUID has correct format"""
     note = Note("Test note")
-    uuid_parts = note._uuid.split('-')
 
-    assert len(uuid_parts) == 5
-    assert len(uuid_parts[0]) == 8
-    assert len(uuid_parts[1]) == 4
-    assert len(uuid_parts[2]) == 4
-    assert len(uuid_parts[3]) == 4
-    assert len(uuid_parts[4]) == 12
+    assert _UUID_RE.match(note._uuid)
 
 
 def test_multiple_notes_independent():
@@ -597,3 +486,57 @@ def test_edit_tags_replaces_completely():
     assert "old2" not in note.tags
     assert "old3" not in note.tags
     assert note.tags == ["new1"]
+
+
+# Tests for lowercase search caches
+
+def test_lowercase_caches_set_on_init():
+    """Test that lowercase text and tags are cached on creation"""
+    note = Note("Test NOTE", ["Work", "URGENT"])
+
+    assert note._text_lower == "test note"
+    assert note._tags_lower == ("work", "urgent")
+    assert note._tag_set == frozenset({"work", "urgent"})
+
+
+def test_lowercase_caches_follow_changes():
+    """Test that lowercase caches are refreshed when text or tags change"""
+    note = Note("Old text", ["Tag1"])
+
+    note.text = "New TEXT"
+    note.add_tag("Tag2")
+    assert note._text_lower == "new text"
+    assert note._tags_lower == ("tag1", "tag2")
+
+    note.remove_tag("Tag1")
+    assert note._tags_lower == ("tag2",)
+
+    note.edit_tags(["Final"])
+    assert note._tags_lower == ("final",)
+    assert note._tag_set == frozenset({"final"})
+
+
+def test_setstate_restores_legacy_note():
+    """Test that notes pickled without caches are restored with them"""
+    note = Note.__new__(Note)
+    note.__setstate__({
+        "_uuid": "legacy-id",
+        "text": "Legacy Text",
+        "tags": ["Old"],
+        "created_at": datetime(2024, 1, 1),
+        "updated_at": datetime(2024, 1, 1),
+    })
+
+    assert note.text == "Legacy Text"
+    assert note.tags == ["Old"]
+    assert note._text_lower == "legacy text"
+    assert note._tags_lower == ("old",)
+
+
+def test_pickle_round_trip_keeps_slots():
+    """Test that slotted notes survive pickling with their caches"""
+    note = pickle.loads(pickle.dumps(Note("Pickled Text", ["Tag"])))
+
+    assert not hasattr(note, "__dict__")
+    assert note.text == "Pickled Text"
+    assert note._tag_set == frozenset({"tag"})
@@ -1,9 +1,20 @@
+import re
+
 import pytest
-import time
 
 from models.note import Note
 from models.notebook import NoteBook
 
+pytestmark = [pytest.mark.xdist_group("notebook"), pytest.mark.usefixtures("fast_clock")]
+
+
+def _fill(notebook, count):
+    """Add `count` notes named "Note 0".."Note N-1" to the notebook and return them"""
+    notes = [Note(f"Note {i}") for i in range(count)]
+    for note in notes:
+        notebook.add_note(note)
+    return notes
+
 
 # Tests for NoteBook initialization
 
@@ -47,18 +58,10 @@ def test_add_note_success():
 def test_add_multiple_notes():
     """Test adding multiple notes"""
     notebook = NoteBook()
-    note1 = Note("Note 1")
-    note2 = Note("Note 2")
-    note3 = Note("Note 3")
-
-    notebook.add_note(note1)
-    notebook.add_note(note2)
-    notebook.add_note(note3)
+    notes = _fill(notebook, 3)
 
     assert len(notebook) == 3
-    assert note1._uuid in notebook.notes
-    assert note2._uuid in notebook.notes
-    assert note3._uuid in notebook.notes
+    assert all(note._uuid in notebook.notes for note in notes)
 
 
 def test_add_note_updates_existing():
@@ -82,44 +85,14 @@ def test_add_note_updates_existing():
     assert "tag2" in notebook.notes[note._uuid].tags
 
 
-def test_add_note_invalid_type_string():
-    """Test adding a string instead of Note raises TypeError"""
-    notebook = NoteBook()
-
-    with pytest.raises(TypeError) as exc_info:
-        notebook.add_note("not a note")
-
-    assert "Only Note objects can be added" in str(exc_info.value)
-
-
-def test_add_note_invalid_type_dict():
-    """Test adding a dict instead of Note raises TypeError"""
-    notebook = NoteBook()
-
-    with pytest.raises(TypeError) as exc_info:
-        notebook.add_note({"text": "note"})
-
-    assert "Only Note objects can be added" in str(exc_info.value)
-
-
-def test_add_note_invalid_type_none():
-    """Test adding None raises TypeError"""
+@pytest.mark.parametrize("bad", ["not a note", {"text": "note"}, None, 123],
+                         ids=["string", "dict", "none", "number"])
+def test_add_note_invalid_type(bad):
+    """Test adding anything other than a Note raises TypeError"""
     notebook = NoteBook()
 
-    with pytest.raises(TypeError) as exc_info:
-        notebook.add_note(None)
-
-    assert "Only Note objects can be added" in str(exc_info.value)
-
-
-def test_add_note_invalid_type_number():
-    """Test adding a number raises TypeError"""
-    notebook = NoteBook()
-
-    with pytest.raises(TypeError) as exc_info:
-        notebook.add_note(123)
-
-    assert "Only Note objects can be added" in str(exc_info.value)
+    with pytest.raises(TypeError, match=re.escape(NoteBook.WRONG_TYPE_MESSAGE)):
+        notebook.add_note(bad)
 
 
 # Tests for delete_note method
@@ -147,33 +120,26 @@ def test_delete_note_non_existing():
     assert len(notebook) == 0
 
 
-def test_delete_note_from_multiple():
-    """Test deleting one note from multiple"""
-    notebook = NoteBook()
-    note1 = Note("Note 1")
-    note2 = Note("Note 2")
-    note3 = Note("Note 3")
-
-    notebook.add_note(note1)
-    notebook.add_note(note2)
-    notebook.add_note(note3)
+@pytest.mark.parametrize("delete_index", [0, 1, 2], ids=["first", "middle", "last"])
+def test_delete_note_from_multiple(fresh_three_note_book, three_note_book, delete_index):
+    """Test deleting one note from multiple leaves the others in place"""
+    notebook = fresh_three_note_book
+    notes = notebook.get_all_notes(sort_by="text", reverse=False)
+    deleted = notes.pop(delete_index)
 
-    result = notebook.delete_note(note2._uuid)
+    result = notebook.delete_note(deleted._uuid)
 
     assert result is True
     assert len(notebook) == 2
-    assert note1._uuid in notebook.notes
-    assert note2._uuid not in notebook.notes
-    assert note3._uuid in notebook.notes
+    assert deleted._uuid not in notebook.notes
+    assert all(note._uuid in notebook.notes for note in notes)
+    assert len(three_note_book) == 3
 
 
 def test_delete_all_notes():
     """Test deleting all notes one by one"""
     notebook = NoteBook()
-    notes = [Note(f"Note {i}") for i in range(5)]
-
-    for note in notes:
-        notebook.add_note(note)
+    notes = _fill(notebook, 5)
 
     for note in notes:
         result = notebook.delete_note(note._uuid)
@@ -210,9 +176,7 @@ def test_get_all_notes_default_sort():
     """Test getting all notes with default sorting (created)"""
     notebook = NoteBook()
     note1 = Note("First note")
-    time.sleep(0.01)
     note2 = Note("Second note")
-    time.sleep(0.01)
     note3 = Note("Third note")
 
     notebook.add_note(note1)
@@ -228,24 +192,34 @@ def test_get_all_notes_default_sort():
     assert notes[2] == note1
 
 
-def test_get_all_notes_sort_by_created():
-    """Test sorting by created date"""
+@pytest.fixture
+def three_sorted():
+    """Return a notebook whose three notes order differently by created, text and tags"""
     notebook = NoteBook()
-    note1 = Note("First")
-    time.sleep(0.01)
-    note2 = Note("Second")
-    time.sleep(0.01)
-    note3 = Note("Third")
+    note1 = Note("Zebra", ["mango"])
+    note2 = Note("Apple", ["zulu"])
+    note3 = Note("Mango", ["alpha"])
 
-    notebook.add_note(note1)
-    notebook.add_note(note2)
-    notebook.add_note(note3)
+    for note in (note1, note2, note3):
+        notebook.add_note(note)
 
-    notes = notebook.get_all_notes(sort_by="created")
+    return notebook, note1, note2, note3
 
-    assert notes[0] == note3  # Newest first
-    assert notes[1] == note2
-    assert notes[2] == note1
+
+@pytest.mark.parametrize("sort_by,reverse,expected", [
+    ("created", None, [3, 2, 1]),   # Newest first by default
+    ("created", False, [1, 2, 3]),
+    ("text", None, [2, 3, 1]),      # Apple, Mango, Zebra
+    ("tags", None, [3, 1, 2]),      # alpha, mango, zulu
+    ("text", True, [1, 3, 2]),
+], ids=["created", "created_ascending", "text", "tags", "text_descending"])
+def test_sort_orders(three_sorted, sort_by, reverse, expected):
+    """Test note order for each sorting method, via get_all_notes and get_note_by_number"""
+    notebook, *notes = three_sorted
+    expected_notes = [notes[i - 1] for i in expected]
+
+    assert notebook.get_all_notes(sort_by=sort_by, reverse=reverse) == expected_notes
+    assert notebook.get_note_by_number(1, sort_by=sort_by, reverse=reverse) is expected_notes[0]
 
 
 def test_get_all_notes_sort_by_updated():
@@ -259,7 +233,6 @@ def test_get_all_notes_sort_by_updated():
     notebook.add_note(note2)
     notebook.add_note(note3)
 
-    time.sleep(0.01)
     note1.add_tag("updated")  # This updates note1
 
     notes = notebook.get_all_notes(sort_by="updated")
@@ -267,24 +240,6 @@ def test_get_all_notes_sort_by_updated():
     assert notes[0] == note1  # Most recently updated first
 
 
-def test_get_all_notes_sort_by_text():
-    """Test sorting by text alphabetically"""
-    notebook = NoteBook()
-    note1 = Note("Zebra")
-    note2 = Note("Apple")
-    note3 = Note("Mango")
-
-    notebook.add_note(note1)
-    notebook.add_note(note2)
-    notebook.add_note(note3)
-
-    notes = notebook.get_all_notes(sort_by="text", reverse=False)
-
-    assert notes[0] == note2  # Apple
-    assert notes[1] == note3  # Mango
-    assert notes[2] == note1  # Zebra
-
-
 def test_get_all_notes_sort_by_text_case_insensitive():
     """Test that text sorting is case-insensitive"""
     notebook = NoteBook()
@@ -303,24 +258,6 @@ def test_get_all_notes_sort_by_text_case_insensitive():
     assert notes[2].text == "CHERRY"
 
 
-def test_get_all_notes_sort_by_tags():
-    """Test sorting by tags alphabetically"""
-    notebook = NoteBook()
-    note1 = Note("Note 1", ["zebra"])
-    note2 = Note("Note 2", ["apple"])
-    note3 = Note("Note 3", ["mango"])
-
-    notebook.add_note(note1)
-    notebook.add_note(note2)
-    notebook.add_note(note3)
-
-    notes = notebook.get_all_notes(sort_by="tags", reverse=False)
-
-    assert notes[0] == note2  # apple
-    assert notes[1] == note3  # mango
-    assert notes[2] == note1  # zebra
-
-
 def test_get_all_notes_sort_by_tags_with_no_tags():
     """Test sorting by tags when some notes have no tags"""
     notebook = NoteBook()
@@ -345,7 +282,6 @@ def test_get_all_notes_sort_invalid_method():
     """Test that invalid sort method defaults to 'created'"""
     notebook = NoteBook()
     note1 = Note("First")
-    time.sleep(0.01)
     note2 = Note("Second")
 
     notebook.add_note(note1)
@@ -374,41 +310,23 @@ def test_get_note_by_number_first():
     assert result == note1
 
 
-def test_get_note_by_number_last():
+def test_get_note_by_number_last(three_note_book):
     """Test getting the last note"""
-    notebook = NoteBook()
-    notes = [Note(f"Note {i}") for i in range(5)]
-
-    for note in notes:
-        notebook.add_note(note)
-
-    result = notebook.get_note_by_number(5, sort_by="text")
+    result = three_note_book.get_note_by_number(3, sort_by="text")
 
-    assert result is not None
+    assert result.text == "Cherry"
 
 
-def test_get_note_by_number_middle():
+def test_get_note_by_number_middle(three_note_book):
     """Test getting a middle note"""
-    notebook = NoteBook()
-    note1 = Note("Apple")
-    note2 = Note("Banana")
-    note3 = Note("Cherry")
+    result = three_note_book.get_note_by_number(2, sort_by="text")
 
-    notebook.add_note(note1)
-    notebook.add_note(note2)
-    notebook.add_note(note3)
-
-    result = notebook.get_note_by_number(2, sort_by="text")
-
-    assert result == note2
+    assert result.text == "Banana"
 
 
-def test_get_note_by_number_out_of_range():
+def test_get_note_by_number_out_of_range(three_note_book):
     """Test getting note with out of range number returns None"""
-    notebook = NoteBook()
-    notebook.add_note(Note("Test"))
-
-    result = notebook.get_note_by_number(10)
+    result = three_note_book.get_note_by_number(10)
 
     assert result is None
 
@@ -442,25 +360,6 @@ def test_get_note_by_number_empty_notebook():
     assert result is None
 
 
-def test_get_note_by_number_with_different_sort():
-    """Test getting note with different sorting methods"""
-    notebook = NoteBook()
-    note1 = Note("Zebra", ["alpha"])
-    time.sleep(0.01)
-    note2 = Note("Apple", ["zulu"])
-
-    notebook.add_note(note1)
-    notebook.add_note(note2)
-
-    by_text = notebook.get_note_by_number(1, sort_by="text")
-    by_tags = notebook.get_note_by_number(1, sort_by="tags")
-    by_created = notebook.get_note_by_number(1, sort_by="created")
-
-    assert by_text == note2  # Apple comes first alphabetically
-    assert by_tags == note1  # alpha comes first
-    assert by_created == note2  # note2 was created last
-
-
 # Tests for get_note_id_by_number method
 
 def test_get_note_id_by_number_success():
@@ -876,21 +775,15 @@ def test_notebook_full_workflow():
     assert len(all_notes) == 2
 
 
-def test_notebook_with_many_notes():
+def test_notebook_with_many_notes(many_notes_book):
     """Test notebook with many notes"""
-    notebook = NoteBook()
-    notes = [Note(f"Note {i}", [f"tag{i % 5}"]) for i in range(100)]
-
-    for note in notes:
-        notebook.add_note(note)
-
-    assert len(notebook) == 100
+    assert len(many_notes_book) == 100
 
-    all_notes = notebook.get_all_notes()
+    all_notes = many_notes_book.get_all_notes()
     assert len(all_notes) == 100
 
     # Search by tag
-    results = notebook.search_by_tags(["tag0"])
+    results = many_notes_book.search_by_tags(["tag0"])
     assert len(results) == 20
 
 
@@ -1004,3 +897,19 @@ def test_sorting_with_identical_values():
     assert note1 in sorted_notes
     assert note2 in sorted_notes
     assert note3 in sorted_notes
+
+
+@pytest.mark.parametrize("sort_by", ["created", "updated", "text", "tags", "unknown"])
+@pytest.mark.parametrize("reverse", [None, True, False])
+def test_get_note_by_number_matches_get_all_notes(sort_by, reverse):
+    """Test that every position returns the same note as the fully sorted list, ties included"""
+    notebook = NoteBook()
+    for text, tags in [("b", ["x"]), ("a", []), ("B", ["X"]), ("a", ["y"]), ("c", [])]:
+        notebook.add_note(Note(text, tags))
+    first = next(iter(notebook.notes.values()))
+    for note in notebook.notes.values():
+        note.created_at = note.updated_at = first.created_at
+
+    expected = notebook.get_all_notes(sort_by, reverse=reverse)
+
+    assert [notebook.get_note_by_number(i, sort_by, reverse=reverse) for i in range(1, 6)] == expected
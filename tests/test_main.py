@@ -4,11 +4,11 @@ Tests for the main module.
 This module contains tests for the main functionality and get_output_by_command.
 """
 
-from unittest.mock import patch
-from main import get_output_by_command
+from main import get_output_by_command, _COMMAND_HANDLERS
 from core.commands import Command
 from models.address_book import AddressBook
 from models.notebook import NoteBook
+from tests.helpers import assert_arg_error, assert_notes_found
 
 
 class TestGetOutputByCommand:
@@ -62,6 +62,17 @@ class TestGetOutputByCommand:
         assert is_exit is False
         assert output == "Unknown command. Please try again."
 
+    def test_partial_command_is_unknown(self):
+        """Test that a prefix of a command is not dispatched as that command."""
+        output, is_exit = get_output_by_command("stat", [], AddressBook(), NoteBook())
+        assert is_exit is False
+        assert output == "Unknown command. Please try again."
+
+    def test_every_command_has_handler(self):
+        """Test that every non-exit command is registered in the dispatch table."""
+        exits = {Command.EXIT_1, Command.EXIT_2}
+        assert set(_COMMAND_HANDLERS) == set(Command) - exits
+
     def test_help_command(self):
         """Test help command."""
         book = AddressBook()
@@ -99,7 +110,7 @@ class TestNoteCommands:
         notebook = NoteBook()
         output, is_exit = get_output_by_command(Command.ADD_NOTE, [], book, notebook)
         assert is_exit is False
-        assert "requires" in output.lower() or "required" in output.lower() or "argument" in output.lower()
+        assert_arg_error(output)
 
     def test_add_note_command_empty_text(self):
         """Test add-note command with empty text."""
@@ -128,7 +139,7 @@ class TestNoteCommands:
         notebook = NoteBook()
         output, is_exit = get_output_by_command(Command.LIST_NOTES, [], book, notebook)
         assert is_exit is False
-        assert "notes" in output.lower() and "found" in output.lower()
+        assert_notes_found(output)
 
     def test_list_notes_command_with_notes(self):
         """Test list-notes command with existing notes."""
@@ -184,7 +195,7 @@ class TestNoteCommands:
 
         output, is_exit = get_output_by_command(Command.SEARCH_NOTES, ["nonexistent"], book, notebook)
         assert is_exit is False
-        assert "notes" in output.lower() and "found" in output.lower()
+        assert_notes_found(output)
 
     def test_search_notes_command_empty_query(self):
         """Test search-notes command without query."""
@@ -192,7 +203,7 @@ class TestNoteCommands:
         notebook = NoteBook()
         output, is_exit = get_output_by_command(Command.SEARCH_NOTES, [], book, notebook)
         assert is_exit is False
-        assert "requires" in output.lower() or "required" in output.lower() or "argument" in output.lower()
+        assert_arg_error(output)
 
     def test_search_notes_command_empty_notebook(self):
         """Test search-notes command in empty notebook."""
@@ -200,7 +211,7 @@ class TestNoteCommands:
         notebook = NoteBook()
         output, is_exit = get_output_by_command(Command.SEARCH_NOTES, ["anything"], book, notebook)
         assert is_exit is False
-        assert "notes" in output.lower() and "found" in output.lower()
+        assert_notes_found(output)
 
     def test_search_tags_command_found(self):
         """Test search-tags command with results."""
@@ -233,7 +244,7 @@ class TestNoteCommands:
 
         output, is_exit = get_output_by_command(Command.SEARCH_TAGS, ["tag2"], book, notebook)
         assert is_exit is False
-        assert "notes" in output.lower() and "found" in output.lower()
+        assert_notes_found(output)
 
     def test_search_tags_command_empty_args(self):
         """Test search-tags command without arguments."""
@@ -241,7 +252,7 @@ class TestNoteCommands:
         notebook = NoteBook()
         output, is_exit = get_output_by_command(Command.SEARCH_TAGS, [], book, notebook)
         assert is_exit is False
-        assert "requires" in output.lower() or "required" in output.lower() or "argument" in output.lower()
+        assert_arg_error(output)
 
     def test_search_tags_command_no_valid_tags(self):
         """Test search-tags command with only invalid tags."""
@@ -300,7 +311,7 @@ class TestNoteCommands:
         notebook = NoteBook()
         output, is_exit = get_output_by_command(Command.EDIT_NOTE, ["1"], book, notebook)
         assert is_exit is False
-        assert "requires" in output.lower() or "required" in output.lower() or "argument" in output.lower()
+        assert_arg_error(output)
 
     def test_edit_note_command_empty_args(self):
         """Test edit-note command without arguments."""
@@ -308,7 +319,7 @@ class TestNoteCommands:
         notebook = NoteBook()
         output, is_exit = get_output_by_command(Command.EDIT_NOTE, [], book, notebook)
         assert is_exit is False
-        assert "requires" in output.lower() or "required" in output.lower() or "argument" in output.lower()
+        assert_arg_error(output)
 
     def test_edit_note_command_with_new_tags(self):
         """Test edit-note command with new tags."""
@@ -325,10 +336,9 @@ class TestNoteCommands:
         assert is_exit is False
         assert "updated" in output.lower()
 
-    @patch('core.handlers.confirm_delete')
-    def test_delete_note_command_by_number(self, mock_confirm):
+    def test_delete_note_command_by_number(self, mocker):
         """Test delete-note command by number."""
-        mock_confirm.return_value = True
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
         book = AddressBook()
         notebook = NoteBook()
         get_output_by_command(Command.ADD_NOTE, ["Test note"], book, notebook)
@@ -338,10 +348,9 @@ class TestNoteCommands:
         assert "deleted" in output.lower()
         assert len(notebook) == 0
 
-    @patch('core.handlers.confirm_delete')
-    def test_delete_note_command_by_text(self, mock_confirm):
+    def test_delete_note_command_by_text(self, mocker):
         """Test delete-note command by text fragment."""
-        mock_confirm.return_value = True
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
         book = AddressBook()
         notebook = NoteBook()
         get_output_by_command(Command.ADD_NOTE, ["Delete this note"], book, notebook)
@@ -364,12 +373,11 @@ class TestNoteCommands:
         notebook = NoteBook()
         output, is_exit = get_output_by_command(Command.DELETE_NOTE, [], book, notebook)
         assert is_exit is False
-        assert "requires" in output.lower() or "required" in output.lower() or "argument" in output.lower()
+        assert_arg_error(output)
 
-    @patch('core.handlers.confirm_delete')
-    def test_delete_note_command_from_multiple(self, mock_confirm):
+    def test_delete_note_command_from_multiple(self, mocker):
         """Test deleting one note from multiple."""
-        mock_confirm.return_value = True
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
         book = AddressBook()
         notebook = NoteBook()
         get_output_by_command(Command.ADD_NOTE, ["Note 1"], book, notebook)
@@ -387,7 +395,7 @@ class TestNoteCommands:
 class TestNoteCommandsIntegration:
     """Integration tests for note commands workflow."""
 
-    def test_complete_note_workflow(self):
+    def test_complete_note_workflow(self, mocker):
         """Test complete workflow with all note commands."""
         book = AddressBook()
         notebook = NoteBook()
@@ -434,10 +442,10 @@ class TestNoteCommandsIntegration:
         assert "updated" in output.lower()
 
         # Delete note
-        with patch('core.handlers.confirm_delete', return_value=True):
-            output, _ = get_output_by_command(Command.DELETE_NOTE, ["2"], book, notebook)
-            assert "deleted" in output.lower()
-            assert len(notebook) == 1
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
+        output, _ = get_output_by_command(Command.DELETE_NOTE, ["2"], book, notebook)
+        assert "deleted" in output.lower()
+        assert len(notebook) == 1
 
     def test_note_commands_with_special_characters(self):
         """Test note commands with special characters."""
@@ -461,7 +469,7 @@ class TestNoteCommandsIntegration:
         output, _ = get_output_by_command(Command.SEARCH_TAGS, ["тег"], book, notebook)
         assert "1 note(s)" in output or "1" in output
 
-    def test_note_commands_with_very_long_text(self):
+    def test_note_commands_with_very_long_text(self, mocker):
         """Test note commands with very long text."""
         book = AddressBook()
         notebook = NoteBook()
@@ -471,9 +479,9 @@ class TestNoteCommandsIntegration:
         assert "added" in output.lower()
 
         # Delete should show truncated text
-        with patch('core.handlers.confirm_delete', return_value=True):
-            output, _ = get_output_by_command(Command.DELETE_NOTE, ["1"], book, notebook)
-            assert "deleted" in output.lower()
+        mocker.patch('core.handlers.confirm_delete', return_value=True)
+        output, _ = get_output_by_command(Command.DELETE_NOTE, ["1"], book, notebook)
+        assert "deleted" in output.lower()
 
     def test_note_commands_error_sequence(self):
         """Test error handling in sequence of operations."""
@@ -482,7 +490,7 @@ class TestNoteCommandsIntegration:
 
         # Try operations on empty notebook
         output, _ = get_output_by_command(Command.SEARCH_NOTES, ["test"], book, notebook)
-        assert "notes" in output.lower() and "found" in output.lower()
+        assert_notes_found(output)
 
         output, _ = get_output_by_command(Command.DELETE_NOTE, ["1"], book, notebook)
         assert "not found" in output.lower()